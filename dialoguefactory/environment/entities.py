@@ -41,6 +41,10 @@ class BaseEntity:
     descriptions: dict
         It stores the previously generated descriptions after they are converted to Phrase-s. It is done,
         so that the phrases can be reused and time can be saved.
+    description_elems : tuple or None
+        A pair (description, elements) that stores the elements of the description without the leading "the".
+        The pair is only valid while description is the entity's current description.
+        Please check user_policies.agent_desc_elements for more information.
     random_gen : random.Random
         The random generator is used instead of random, so that if the dialogue is run again
         the same generation process will proceed.
@@ -53,6 +57,7 @@ class BaseEntity:
         self.undo_changes = ([] if undo_changes is None else undo_changes)
         self.description = None
         self.descriptions = dict()
+        self.description_elems = None
         self.random_gen = random.Random() if random_gen is None else random_gen
 
     def __eq__(self, other):
@@ -130,6 +135,7 @@ class BaseEntity:
         else:
             setattr(result, 'description', self.description)
         setattr(result, 'descriptions', copy.copy(self.descriptions))
+        setattr(result, 'description_elems', None)
 
         return result
 
@@ -211,8 +217,9 @@ class Entity(BaseEntity):
     prop_seen: dict
         A mapping property_key : property_value, that indicates what properties are revealed in the context.
     prop_seen_neg: dict
-        A mapping property key => list of property values that are not equal to the correct property value.
-        For example, the entity's size might be 'small', and the list of property values might be ['medium', 'large'].
+        A mapping property key => dict of property values that are not equal to the correct property value.
+        The inner dict maps the hashable version of the value (please check components.prepare_hash) to the value.
+        For example, the entity's size might be 'small', and the property values might be 'medium' and 'large'.
         The properties have to be revealed in the context.
     attr_seen : dict
         A mapping attribute : None that indicates what attributes are revealed in the context.
@@ -284,6 +291,7 @@ class Entity(BaseEntity):
             setattr(result, 'description', None)
 
         setattr(result, 'descriptions', copy.copy(self.descriptions))
+        setattr(result, 'description_elems', None)
         setattr(result, 'world', self.world)
         setattr(result, 'prop_seen', copy.copy(self.prop_seen))
         setattr(result, 'attr_seen', copy.copy(self.attr_seen))
@@ -499,12 +507,13 @@ class Entity(BaseEntity):
 
         log = []
         player_top_loc = player.top_location()
+        location_top_loc = location_entity.top_location()
         if 'player' not in player.attributes:
             log.append(tsentences.cont([neg_res, tsentences.be(player, 'is', 'not', 'player')]))
 
-        if (('type' in self.properties and self.properties['type'] != 'door') or 'type' not in self.properties) and location_entity.top_location() != player_top_loc:
+        if (('type' in self.properties and self.properties['type'] != 'door') or 'type' not in self.properties) and location_top_loc != player_top_loc:
             log.append(tsentences.cont([neg_res, tsentences.be([player, "'s", 'location'],
-                                       'is', 'not', ['in', location_entity.top_location()])]))
+                                       'is', 'not', ['in', location_top_loc])]))
 
         if ('type' in self.properties and self.properties['type'] == 'door' and
                 "door_to" in self.properties and
@@ -523,7 +532,7 @@ class Entity(BaseEntity):
             log.append(tsentences.cont([neg_res, res1, res2]))
 
         if (("container" in location_entity.attributes and
-                self.properties["location"][1] != location_entity.top_location())):
+                self.properties["location"][1] != location_top_loc)):
             curr_loc = location_entity
             log_locked = []
             log_not_open = []
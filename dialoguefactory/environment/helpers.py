@@ -62,7 +62,7 @@ def extract_tries_sent(sentence, world):
         player = None
     inner_utter = tries_describer.get_arg('Arg-PPT')
     if isinstance(player, em.Entity):
-        player = getattr(world, player.properties.get("var_name"), None)
+        player = world.var_name_map.get(player.properties.get("var_name"), None)
     else:
         player = None
     if sentence != tsentences.tries((player, None),
@@ -75,6 +75,20 @@ def extract_tries_sent(sentence, world):
     return inner_utter, player
 
 
+def extract_prep_location(prep_location, world):
+    """ Extracts the preposition and the world's entity from a location in the form:
+
+            [<preposition>, <entity>]
+
+        For example, ['in', toys_container] is extracted as ('in', world.toys_container).
+        If the location is not in this form, None is returned.
+    """
+    if (type(prep_location) is list and len(prep_location) == 2
+            and type(prep_location[0]) is str and isinstance(prep_location[1], em.Entity)):
+        return prep_location[0], world.var_name_map[prep_location[1].properties.get("var_name")]
+    return None
+
+
 def item_path(item):
     """ Returns all locations of the item that lead to the top location.
         The list includes the item itself.
@@ -26,10 +26,17 @@ class World:
     <var_name> : Entity
         For easier fetching of the entities (instead of looking for them in the list),
         self.<entity_var_name> can be used to get an entity. For example, self.rug or self.main_door.
+    var_name_map : dict
+        A dictionary mapping var_name => Entity. It stores the same entities as self.<var_name>, but
+        the entities can be fetched with a single dictionary lookup instead of getattr(self, <var_name>).
     directions : list
         A list of strings representing all directions used in the world. For example: north, northeast, south, ...
     all_properties : list
         A list of all property keys that the entities in the world have.
+    val_is_key_prds : frozenset
+        The property keys that can appear as a predicate in the sentence "<property_value> is (not) <property_key>".
+        These are self.all_properties, 'direction' and the player's ('player', name/nickname/surname).
+        The set is rebuilt whenever self.all_properties changes (please check self.update_val_is_key_prds).
     all_attributes : list
         A list of all attributes that the entities in the world have.
     <property_key>s : list
@@ -55,6 +62,10 @@ class World:
     all_paths: dict
         A dictionary mapping
         (location A, location B) => list of directions that lead the play from location A to location B.
+    resolved_paths: dict
+        A cache mapping (location A, location B) => list of tuples (direction, location, obstacle) computed
+        from all_paths. Each tuple contains the location where the direction is taken and the obstacle
+        in that direction (or None). Please check self.get_resolved_path.
     change_action_properties : list
         The list of properties that can be changed. This member is used by the
         :func:`actions.change() <dialoguefactory.environment.actions.change>` function.
@@ -71,11 +82,14 @@ class World:
                  all_description_objects=None, location_positions=None, init=True):
         self.obj_list = obj_list if obj_list is not None else list()
         self.undo_changes = undo_changes if undo_changes is not None else list()
+        self.var_name_map = dict()
         self.directions = list()
         self.all_properties = list()
+        self.val_is_key_prds = frozenset()
         self.all_attributes = list()
         self.graph = dijkstar.Graph()
         self.all_paths = dict()
+        self.resolved_paths = dict()
         self.change_action_properties = ['color',
                                          'size',
                                          'nickname',
@@ -104,9 +118,11 @@ class World:
 
         for obj in self.obj_list:
             setattr(self, obj.properties['var_name'], obj)
+            self.var_name_map[obj.properties['var_name']] = obj
 
         self.directions += list_diff(self.compute_directions(), self.directions)
         self.all_properties += list_diff(self.get_properties(), self.all_properties)
+        self.update_val_is_key_prds()
         self.all_attributes += list_diff(self.get_attributes(), self.all_attributes)
 
         self.update_all_attributes()
@@ -123,11 +139,13 @@ class World:
         self.obj_list += diff_objs
         for obj in diff_objs:
             setattr(self, obj.properties['var_name'], obj)
+            self.var_name_map[obj.properties['var_name']] = obj
 
         for obj in diff_objs:
             obj.change_world(self)
         del self.all_properties[:]
         self.all_properties += self.get_properties()
+        self.update_val_is_key_prds()
         del self.all_attributes[:]
         self.all_attributes += self.get_attributes()
 
@@ -160,6 +178,12 @@ class World:
         """ Removes the saved changes in order to save memory. """
         del self.undo_changes[:]
 
+    def dry_run(self):
+        """ Returns a context manager that undoes all the world changes made inside the with block.
+            Please check the class WorldDryRun for more information.
+        """
+        return WorldDryRun(self)
+
     def find_all_vals(self, prop_key):
         """ Finds all the property values in the world for a given property key. """
         vals = []
@@ -226,6 +250,11 @@ class World:
                 prop_list_new = getattr(new_world, "player_"+prop+"s", [])
                 prop_list += list_diff(prop_list_new, prop_list)
 
+    def update_val_is_key_prds(self):
+        """ Rebuilds self.val_is_key_prds from self.all_properties. """
+        additional_prds = [('player', prop) for prop in ['name', 'nickname', 'surname']]
+        self.val_is_key_prds = frozenset(self.all_properties + ['direction'] + additional_prds)
+
     def update_all_attributes(self):
         """ Updates all self.<attribute>s. This function is useful after adding new objects,
             or when merging worlds.
@@ -300,12 +329,30 @@ class World:
 
     def update_paths(self):
         """ Update all the paths. This function is useful when the list of places is modified. """
+        self.resolved_paths.clear()
         for source in self.places:
             for target in self.places:
                 path = path_helpers.find_shortest_path(source, target, self.graph)
                 if path is not None:
                     self.all_paths[(source, target)] = path
 
+    def get_resolved_path(self, source, target):
+        """ Returns the path from the source to the target location as a list of tuples (direction, location, obstacle).
+            The location is the place where the direction is taken, and the obstacle is the one found in
+            that direction (None if there is no obstacle). If there is no path, an empty list is returned.
+            The result is cached until the paths are updated.
+        """
+        key = (source, target)
+        resolved = self.resolved_paths.get(key)
+        if resolved is None:
+            resolved = []
+            loc = source
+            for direction in self.all_paths.get(key, []):
+                resolved.append((direction, loc, loc.properties.get((direction, 'obstacle'))))
+                loc = loc.properties[direction]
+            self.resolved_paths[key] = resolved
+        return resolved
+
     def update_graph(self):
         """ Update the graph after the places and/or directions are modified."""
         for loc in self.places:
@@ -355,6 +402,61 @@ class World:
         return filtered_objects
 
 
+class WorldDryRun:
+    """
+    A context manager used for trying out actions in the world without keeping their changes.
+
+    The world changes are already recorded as undo functions in world.undo_changes, so only the changes made
+    inside the with block are undone on exit. The changes are undone even if an exception is raised.
+
+    ..  code-block:: python
+
+        with world.dry_run():
+            res = actions.get(item, player)
+
+    The mark and rollback methods allow trying out several actions starting from the same state:
+
+    ..  code-block:: python
+
+        with world.dry_run() as dry_run:
+            dry_run.mark()
+            res = actions.get(item, player)
+            dry_run.rollback()
+            other_res = actions.drop(item, location, player)
+
+    Attributes
+    ----------
+    world : World
+        The world where the actions are tried out.
+    state : int or None
+        The world state when entering the with block.
+    mark_state : int or None
+        The world state saved by the last call of mark.
+    """
+    def __init__(self, world):
+        self.world = world
+        self.state = None
+        self.mark_state = None
+
+    def __enter__(self):
+        self.state = self.world.save_state()
+        return self
+
+    def mark(self):
+        """ Saves the current world state, so that the later changes inside the with block can be undone
+            by calling rollback.
+        """
+        self.mark_state = self.world.save_state()
+
+    def rollback(self):
+        """ Undoes the changes made after the last call of mark. """
+        self.world.recover_state(self.mark_state)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.world.recover_state(self.state)
+        return False
+
+
 def filter_items(all_objects, filter_conditions=None):
     """ Returns the objects from the list all_objects that satisfy the given conditions.
 
@@ -4,6 +4,7 @@
 This module contains the Dialogue class, which controls the dialogue between one or more agents in the world.
 """
 
+import bisect
 import copy
 import random
 import secrets
@@ -33,6 +34,14 @@ class Dialogue:
         The participants' policies. The policies should follow the base_policies.Policy interface.
     utterances : list
         The list of dialogue utterances uttered by the policies.
+        The list is append-only: player_utters appends the new utterances and recover_state is the only
+        method that rewrites it. Outside code must not modify it.
+    speaker_utters_ids : dict
+        A mapping speaker => sorted list of ids of the utterances in self.utterances uttered by the speaker.
+        The index is updated incrementally when the speaker's utterances are fetched,
+        and it is reset by recover_state.
+    num_indexed_utters : int
+        The number of utterances from self.utterances that are added in self.speaker_utters_ids.
     curr_speaker : Entity
         The player whose policy is executed on the current turn.
     counter : int
@@ -78,6 +87,8 @@ class Dialogue:
         self.dia_generator = dia_generator
         self.policies = policies if policies is not None else list()
         self.utterances = list()
+        self.speaker_utters_ids = dict()
+        self.num_indexed_utters = 0
         self.curr_speaker = None
         self.counter = 0
         self.next_policy_id = 0
@@ -113,6 +124,7 @@ class Dialogue:
         """ Recovers the state of all class members that change with time """
         del self.utterances[:]
         self.utterances.extend(state[0])
+        self.reset_utters_index()
         self.dia_generator.recover_state(state[1])
         del self.policies[:]
         self.policies.extend(state[2])
@@ -315,13 +327,30 @@ class Dialogue:
             players.append(pol.player)
         return players
 
-    def get_player_utters(self, player):
-        """ Fetches all the utterances that belong to a player. """
-        player_utters = []
-        for utter in self.utterances:
-            if utter.speaker == player:
-                player_utters.append(utter)
-        return player_utters
+    def reset_utters_index(self):
+        """ Clears the index of the speakers' utterances. The index is rebuilt on the next fetch. """
+        self.speaker_utters_ids.clear()
+        self.num_indexed_utters = 0
+
+    def index_utterances(self):
+        """ Adds the utterances that are not yet indexed to self.speaker_utters_ids. """
+        num_utters = len(self.utterances)
+        for idx in range(self.num_indexed_utters, num_utters):
+            self.speaker_utters_ids.setdefault(self.utterances[idx].speaker, []).append(idx)
+        self.num_indexed_utters = num_utters
+
+    def get_player_utters(self, player, start_id=0):
+        """ Fetches all the utterances that belong to a player starting from a specific point in the dialogue. """
+        self.index_utterances()
+        utters_ids = self.speaker_utters_ids.get(player, [])
+        start = bisect.bisect_left(utters_ids, start_id)
+        return [self.utterances[idx] for idx in utters_ids[start:]]
+
+    def has_player_utters(self, player, start_id=0):
+        """ Checks whether the player has uttered anything starting from a specific point in the dialogue. """
+        self.index_utterances()
+        utters_ids = self.speaker_utters_ids.get(player, [])
+        return bisect.bisect_left(utters_ids, start_id) < len(utters_ids)
 
     def get_utterances(self):
         """ Gets the dialogue utterances. """
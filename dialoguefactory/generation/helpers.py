@@ -222,10 +222,16 @@ def reduce_and_extract(sentences, add_original=False):
 
 def make_dynamic_copy(pol):
     """ Makes a new instance of the policy class and assigns the same class member references
-        as the old one.
+        as the old one. Both the members stored in the __slots__ and in the __dict__ are assigned.
     """
-    attributes = vars(pol)
     pol_class = pol.__class__
+    attributes = dict()
+    for cls in reversed(pol_class.__mro__):
+        for key in cls.__dict__.get("__slots__", ()):
+            if hasattr(pol, key):
+                attributes[key] = getattr(pol, key)
+    attributes.update(getattr(pol, "__dict__", {}))
+
     new_pol = pol_class.__new__(pol_class)
     for key, val in attributes.items():
         setattr(new_pol, key, val)
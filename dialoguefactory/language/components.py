@@ -16,10 +16,10 @@ except OSError:
 
 logger = logging.getLogger(__name__)
 
-PRESENT_TENSES = ['VB', 'VBP', 'VBZ']
-PAST_TENSES = ['VBD']
-PRESENT_PARTICIPLE_TENSES = ['VBG']
-PAST_PARTICIPLE_TENSES = ['VBN']
+PRESENT_TENSES = frozenset(['VB', 'VBP', 'VBZ'])
+PAST_TENSES = frozenset(['VBD'])
+PRESENT_PARTICIPLE_TENSES = frozenset(['VBG'])
+PAST_PARTICIPLE_TENSES = frozenset(['VBN'])
 cached_tokens = {}
 cached_inflections = {}
 
@@ -133,3 +133,24 @@ def reduce_sentences(sentences, memo=None, add_original=False):
                 reduced += reduce_sentences(reduc, memo, add_original)
 
     return reduced
+
+
+def reduce_sentences_each(sentences, add_original=False):
+    """
+    Reduces each of the sentences separately. Please check reduce_sentences for more information.
+
+    Parameters
+    ----------
+    sentences : list
+        The list of sentences to be reduced.
+    add_original : bool, optional
+        Whether to add the original/unreduced form of each sentence to its list.
+
+    Returns
+    -------
+    reduced : list of lists
+        The reduced sentences of each of the sentences.
+        Every sentence gets its own memo, so the sentences shared between two inputs are kept in both lists.
+
+    """
+    return [reduce_sentences([sent], None, add_original) for sent in sentences]
@@ -1030,7 +1030,7 @@ class IsItemPolicy(bpolicies.IsItem):
                     neg_response.describers += [desc]
                     dont_know_res = tsentences.know(self.player, "not", "know", neg_response, speaker=self.player)
 
-                    is_not_res = tsentences.be((None, lc.Word("There")), "is", "not",
+                    is_not_res = tsentences.be((None, phelpers.WORD_THERE), "is", "not",
                                                ['a', item, "with"]+property_key +
                                                (list(property_val) if isinstance(property_val, (set, tuple, list)) else [property_val]), speaker=self.player)
                     steps, goal = self.one_task(item, is_not_res, dont_know_res, neg_res_func, last_user_command,
@@ -1208,7 +1208,7 @@ class IsItemAttributePolicy(bpolicies.IsItem):
                 statement.describers = [desc]
                 dont_know_res = tsentences.know(self.player, "not", "know", statement, speaker=self.player)
 
-                is_not_res = tsentences.be((None, lc.Word("There")), "is", "not",
+                is_not_res = tsentences.be((None, phelpers.WORD_THERE), "is", "not",
                                            item +['with', 'attribute', attribute], speaker=self.player)
 
                 steps, goal = self.one_task(item[1], is_not_res, dont_know_res, neg_res_func, last_user_command,
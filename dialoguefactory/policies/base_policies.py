@@ -23,6 +23,8 @@ class Policy(ABC):
     dialogue : Dialogue, optional
         The current dialogue that the policy is part of.
     """
+    __slots__ = ("player", "dialogue")
+
     def __init__(self, player=None, dialogue=None):
         self.player = player
         self.dialogue = dialogue
@@ -16,6 +16,10 @@ from ..language import desc_mappers
 
 logger = logging.getLogger(__name__)
 
+# maps the verb of the tries sentence to the sentence and the action function of the OpenClosePolicy
+OPEN_CLOSE_FUNCS = {"opening": (tsentences.opens, actions.opens),
+                    "closing": (tsentences.close, actions.closes)}
+
 
 class EnvPolicy(bpolicies.Policy):
     """ The environment policy provides a response to every player's action.
@@ -156,7 +160,7 @@ class GoPolicy(EnvPolicy):
             if from_location is not None:
                 if (isinstance(from_location, list) and len(from_location) == 2
                         and from_location[0] == "from" and isinstance(from_location[1], em.Entity)):
-                    from_location = getattr(world, from_location[1].properties.get("var_name"), from_location)
+                    from_location = world.var_name_map.get(from_location[1].properties.get("var_name"), from_location)
                 else:
                     return None
 
@@ -194,17 +198,16 @@ class GetPolicy(EnvPolicy):
                                               entity=(entity, None),
                                               prepos_location=(prep_location, None))):
             if isinstance(entity, em.Entity):
-                entity = getattr(world, entity.properties.get("var_name"))
+                entity = world.var_name_map[entity.properties.get("var_name")]
             else:
                 return None
             if prep_location is None:
                 location_position, location = None, None
-            elif (isinstance(prep_location, list) and len(prep_location) == 2
-                    and isinstance(prep_location[0], str) and isinstance(prep_location[1], em.Entity)):
-                location_position = prep_location[0]
-                location = getattr(world, prep_location[1].properties.get("var_name"))
             else:
-                return None
+                prep_entity = env_helpers.extract_prep_location(prep_location, world)
+                if prep_entity is None:
+                    return None
+                location_position, location = prep_entity
             res = actions.get(entity, player, location, location_position)
             return res
         return None
@@ -238,14 +241,13 @@ class DropPolicy(EnvPolicy):
                                            )):
             if prep_location is None:
                 location_position, location = None, None
-            elif (isinstance(prep_location, list) and len(prep_location) == 2
-                  and isinstance(prep_location[0], str) and isinstance(prep_location[1], em.Entity)):
-                location_position = prep_location[0]
-                location = getattr(world, prep_location[1].properties.get("var_name"))
             else:
-                return None
+                prep_entity = env_helpers.extract_prep_location(prep_location, world)
+                if prep_entity is None:
+                    return None
+                location_position, location = prep_entity
             if entity is not None and isinstance(entity, em.Entity):
-                entity = getattr(world, entity.properties.get("var_name"))
+                entity = world.var_name_map[entity.properties.get("var_name")]
                 res = actions.drop(entity, player, location, location_position)
                 return res
         return None
@@ -274,15 +276,13 @@ class OpenClosePolicy(EnvPolicy):
         inner_desc = inner_utter.describers[0]
         rel = inner_desc.get_arg('Rel')
 
-        if rel == "opening":
-            res_func = tsentences.opens
-        elif rel == "closing":
-            res_func = tsentences.close
-        else:
+        rel_funcs = OPEN_CLOSE_FUNCS.get(rel)
+        if rel_funcs is None:
             return None
+        res_func, action_func = rel_funcs
         entity = inner_desc.get_arg('Arg-PPT')
         if isinstance(entity, em.Entity):
-            entity = getattr(world, entity.properties.get("var_name"))
+            entity = world.var_name_map[entity.properties.get("var_name")]
         else:
             return None
 
@@ -293,16 +293,12 @@ class OpenClosePolicy(EnvPolicy):
         if inner_utter == action_res:
             if prep_location is None:
                 location_position, location = None, None
-            elif (isinstance(prep_location, list) and len(prep_location) == 2
-                  and isinstance(prep_location[0], str) and isinstance(prep_location[1], em.Entity)):
-                location_position = prep_location[0]
-                location = getattr(world, prep_location[1].properties.get("var_name"))
             else:
-                return None
-            if rel == "opening":
-                res = actions.opens(entity, player, location, location_position)
-            else:
-                res = actions.closes(entity, player, location, location_position)
+                prep_entity = env_helpers.extract_prep_location(prep_location, world)
+                if prep_entity is None:
+                    return None
+                location_position, location = prep_entity
+            res = action_func(entity, player, location, location_position)
             return res
         return None
 
@@ -337,17 +333,15 @@ class LookPolicy(EnvPolicy):
             if prep_thing_looked is None:
                 location_position, location = None, None
                 thing_looked = None
-            elif (isinstance(prep_thing_looked, list) and len(prep_thing_looked) == 2
-                    and isinstance(prep_thing_looked[0], str) and isinstance(prep_thing_looked[1], em.Entity)):
-                location_position = prep_thing_looked[0]
-                thing_looked = getattr(world, prep_thing_looked[1].properties.get("var_name"))
             else:
-                return None
+                prep_entity = env_helpers.extract_prep_location(prep_thing_looked, world)
+                if prep_entity is None:
+                    return None
+                location_position, thing_looked = prep_entity
 
             if thing_looked is not None:
-                thing_looked = getattr(world, thing_looked.properties.get("var_name"), None)
                 res = actions.look(thing_looked, player, location_position,
-                                   [item_location[0], getattr(world, item_location[1].properties.get("var_name"))])
+                                   [item_location[0], world.var_name_map[item_location[1].properties.get("var_name")]])
                 return res
         return None
 
@@ -370,10 +364,8 @@ class SayPolicy(EnvPolicy):
 
         mapped_sent = desc_mappers.say(last_utter.describers)
         if describer.get_arg("AM-NEG") is None and mapped_sent == last_utter:
-            empty_sent = lc.Sentence()
-            empty_sent.describers.append(lc.Describer())
-            empty_sent.speaker = None
-            return empty_sent
+            # a new sentence is returned each time since the callers can change the speaker of the response
+            return lc.Sentence(describers=[lc.Describer(prune=False)], speaker=None)
         return None
 
 
@@ -410,7 +402,7 @@ class ChangePolicy(EnvPolicy):
                 else:
                     element_key = tuple(element_key)
 
-                item = getattr(world, thing_changing[0].properties.get("var_name"))
+                item = world.var_name_map[thing_changing[0].properties.get("var_name")]
                 if isinstance(end_state, list) and len(end_state) >= 2 and end_state[0] == "to":
                     if len(end_state[1:]) == 1:
                         end_state = end_state[1]
@@ -10,6 +10,8 @@ import inspect
 from ..language import describers as tdescribers
 from ..language import helpers as shelpers
 
+cached_signatures = {}
+
 
 class Goal:
     """
@@ -28,6 +30,7 @@ class Goal:
     kwargs : dict
         The keyword arguments of the goal function.
     """
+    __slots__ = ("func", "args", "kwargs")
 
     def __init__(self, func, *args, **kwargs):
         self.func = func
@@ -46,26 +49,34 @@ class Goal:
         return self.func(**new_params)
 
 
-def find_and_replace_params(func, args, kwargs, **params_replace):
+def get_signature_params(func):
     """
-    Replaces the parameters found in args and kwargs with other set of params (params_replace).
+    Caches the names of the function parameters and their default values.
+    Caching saves time computing inspect.signature(func) whenever the goal is executed.
     """
-    new_params = {}
-    signature = dict(inspect.signature(func).parameters)
-    list_params = list(signature.keys())
-    for key, val in signature.items():
-        if val.default is not inspect.Parameter.empty:
-            new_params[key] = val.default
-    for idx, arg in enumerate(args):
-        k = list_params[idx]
-        new_params[k] = arg
+    if func not in cached_signatures:
+        signature = inspect.signature(func).parameters
+        defaults = {key: val.default for key, val in signature.items()
+                    if val.default is not inspect.Parameter.empty}
+        cached_signatures[func] = (tuple(signature.keys()), defaults)
+    return cached_signatures[func]
 
-    for key in kwargs.keys():
-        new_params[key] = kwargs[key]
 
-    for key, val in params_replace.items():
-        if key in list_params:
-            new_params[key] = val
+def find_and_replace_params(func, args, kwargs, **params_replace):
+    """
+    Replaces the parameters found in args and kwargs with other set of params (params_replace).
+    """
+    list_params, defaults = get_signature_params(func)
+    if len(args) > len(list_params):
+        raise TypeError("{}() takes {} positional arguments but {} were given".format(func.__name__,
+                                                                                    len(list_params),
+                                                                                    len(args)))
+    if not args and not params_replace:
+        return {**defaults, **kwargs}
+
+    new_params = {**defaults, **dict(zip(list_params, args)), **kwargs}
+    if params_replace:
+        new_params.update({key: val for key, val in params_replace.items() if key in list_params})
 
     return new_params
 
@@ -75,12 +86,10 @@ def get_player_utters(dialogue, player, start_id):
     Get all the player's utterances from the dialogue starting
     from a specific point in the dialogue.
     """
-    dia_utterances = dialogue.get_utterances()[start_id:]
-    player_prev_utterances = []
-    for utter in dia_utterances:
-        if utter.speaker == player:
-            player_prev_utterances.append(utter)
-    return player_prev_utterances
+    if start_id < 0:
+        # keep the slicing semantics of negative ids
+        start_id = max(len(dialogue.get_utterances()) + start_id, 0)
+    return dialogue.get_player_utters(player, start_id)
 
 
 def correct_steps_sublist(dialogue, player, steps, start_id):
@@ -115,6 +124,8 @@ def multiple_correct(dialogue, player, steps, start_id):
     """ Finds if one of the steps is present in the player's
         utterances starting from a specific point in the dialogue.
     """
+    # The utterances are not hashed, since some of their arguments (e.g. BaseEntity-s with list properties)
+    # are unhashable.
     player_utters = get_player_utters(dialogue, player, start_id)
     for step in steps:
         if step in player_utters:
@@ -134,6 +145,9 @@ def go_to_loc_goal(dialogue, player, location, start_id):
         if len(utter.describers) != 0:
             desc = utter.describers[0]
             direction = desc.get_arg("AM-DIR")
+            # cheap checks first, so the reference describer is only built for candidate utterances
+            if not isinstance(direction, str) or player != desc.get_arg("Arg-PPT"):
+                continue
             start_loc = desc.get_arg("Arg-DIR")
             desc_goes = tdescribers.go((player, None),
                                        (None, None),
@@ -142,7 +156,7 @@ def go_to_loc_goal(dialogue, player, location, start_id):
                                        (direction, None),
                                        (start_loc, None))
 
-            if desc_goes == desc and isinstance(direction, str) and start_loc[-1].properties[direction] == location:
+            if desc_goes == desc and start_loc[-1].properties[direction] == location:
                 return 1
 
     return 0
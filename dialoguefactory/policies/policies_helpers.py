@@ -3,7 +3,7 @@
 """
 This module lists the functions that help with the implementation of the policies.
 """
-import copy
+import functools
 
 from . import goals as tgoals
 from ..language import desc_mappers
@@ -16,6 +16,10 @@ from ..environment import helpers as em_helpers
 from ..environment import actions
 from ..environment import entities as em
 
+# The expletive subject of sentences like "There is no path from the kitchen to the garden."
+# The words are never modified after creation, so a single instance is shared.
+WORD_THERE = lc.Word('There')
+
 
 def compute_policy_steps(policy, item,  can_not_action_res,
                          target_location, prepos_location, action_func,
@@ -99,10 +103,7 @@ def compute_policy_steps(policy, item,  can_not_action_res,
     go_steps, go_goal = policy.go_location_policy.task(item, prepos_location, False)
 
     target_loc = target_location.top_location()
-    loc_is_rev = tsentences.be(([policy.player, "'s", 'location'], None),
-                               ('is', None),
-                               (None, None),
-                               (['in', target_loc], None))
+    loc_is_rev = be_location(policy.player, target_loc)
 
     if policy.dialogue.dia_generator.knowledge_base.check(loc_is_rev):
         go_steps = []
@@ -111,11 +112,15 @@ def compute_policy_steps(policy, item,  can_not_action_res,
     sloc = policy.player.properties['location'][1].top_location()
     tloc = target_loc
 
-    state = policy.dialogue.dia_generator.world.save_state()
-    make_item_reachable(policy.player, sloc, tloc, policy.dialogue.dia_generator.world)
-    open_all_containers(policy.player, item, policy.dialogue.dia_generator.world)
-    orig_res = action_func(*action_params)
-    policy.dialogue.dia_generator.world.recover_state(state)
+    # The action is tried out once with all containers opened and once without opening them.
+    # Both probes share the changes made by make_item_reachable.
+    with policy.dialogue.dia_generator.world.dry_run() as dry_run:
+        make_item_reachable(policy.player, sloc, tloc, policy.dialogue.dia_generator.world)
+        dry_run.mark()
+        open_all_containers(policy.player, item, policy.dialogue.dia_generator.world)
+        orig_res = action_func(*action_params)
+        dry_run.rollback()
+        not_opened_res = action_func(*action_params)
 
     if action_res != shelpers.reduce_sentences([orig_res[0]])[0]:
         flattened_res = extract_reasons(orig_res)
@@ -133,53 +138,37 @@ def compute_policy_steps(policy, item,  can_not_action_res,
                                len(policy.dialogue.get_utterances()) - 1)
             return steps, goal
 
-    state = policy.dialogue.dia_generator.world.save_state()
-    make_item_reachable(policy.player, sloc, tloc, policy.dialogue.dia_generator.world)
-    orig_res = action_func(*action_params)
-    policy.dialogue.dia_generator.world.recover_state(state)
+    orig_res = not_opened_res
 
     substeps = []
     if action_res != shelpers.reduce_sentences([orig_res[0]])[0]:
         candidates_open = []
-        curr_loc = item.properties['location'][1]
+        # The top location is only a candidate when the item is placed directly in it.
+        ancestors = em_helpers.item_path(item)[1:]
+        ancestors = ancestors[:-1] or ancestors
 
         flag_open = True
-        while True:
+        for curr_loc in ancestors:
             if "open" not in curr_loc.attributes:
-                is_locked = tsentences.be((curr_loc, None),
-                                          ("is", None),
-                                          (None, None),
-                                          ("locked", None))
-                is_not_openable = tsentences.be((curr_loc, None),
-                                                ("is", None),
-                                                ("not", None),
-                                                ("openable", None))
-                if (policy.dialogue.dia_generator.knowledge_base.check(is_locked) is True or
-                        policy.dialogue.dia_generator.knowledge_base.check(is_not_openable) is True):
+                know_base = policy.dialogue.dia_generator.knowledge_base
+                if (know_base.check(be_attribute(curr_loc, None, "locked")) is True or
+                        know_base.check(be_attribute(curr_loc, "not", "openable")) is True):
                     flag_open = False
 
                     break
                 candidates_open.insert(0, curr_loc)
-            if 'location' in curr_loc.properties:
-                new_loc = curr_loc.properties['location'][1]
-                if new_loc == new_loc.properties['location'][1]:
-                    break
-                else:
-                    curr_loc = new_loc
-            else:
-                break
         if flag_open:
             for item_loc in candidates_open:
-                res3 = tsentences.be((item_loc, None), ("is", None), (None, None), ("container", None))
-                res1 = tsentences.be((item_loc, None), ("is", None), (None, None), ("openable", None))
-                res2 = tsentences.be((item_loc, None), ("is", None), ("not", None), ("open", None))
+                res3 = be_attribute(item_loc, None, "container")
+                res1 = be_attribute(item_loc, None, "openable")
+                res2 = be_attribute(item_loc, "not", "open")
                 if (prec_steps is None and policy.dialogue.dia_generator.knowledge_base.check(res3) is not False and
                         policy.dialogue.dia_generator.knowledge_base.check(res1) and
                         policy.dialogue.dia_generator.knowledge_base.check(res2)):
                     open_step = tsentences.tries(policy.player, None, None, "tries",
                                                  tsentences.opens(rel="opening",
                                                                   thing_opened=item_loc,
-                                                                  prepos_location=copy.copy(item_loc.properties['location']),
+                                                                  prepos_location=list(item_loc.properties['location']),
                                                                   speaker=policy.player),
                                                  policy.player)
                     substeps.append(open_step)
@@ -207,6 +196,7 @@ def compute_policy_steps(policy, item,  can_not_action_res,
 
                 if prec_steps is not None:
                     if "container" in item.properties["location"][1].attributes:
+                        loc_memo = dict()
                         for step in steps:
                             inner_sentences = shelpers.reduce_sentences([step.describers[0].get_arg('Arg-PPT')])[1:]
 
@@ -215,7 +205,8 @@ def compute_policy_steps(policy, item,  can_not_action_res,
                                     subj = sent.describers[0].get_arg("Arg-PPT")
                                     curr_loc = check_loc(policy.dialogue.dia_generator.knowledge_base,
                                                          item,
-                                                         item.properties['location'])
+                                                         item.properties['location'],
+                                                         loc_memo)
                                     if curr_loc is not None:
                                         loc_path = []
                                         while True:
@@ -231,7 +222,7 @@ def compute_policy_steps(policy, item,  can_not_action_res,
             else:
                 if prec_steps is not None:
                     steps, goal = prec_steps, prec_goal
-                elif len(go_steps) > 0 and desc_mappers.say([go_steps[0].describers[0]]) == go_steps[0] and em_helpers.check_can_not(shelpers.reduce_sentences([go_steps[0].describers[0].get_arg('Arg-PPT')]), "go"):
+                elif len(go_steps) > 0 and is_say(go_steps[0]) and em_helpers.check_can_not(shelpers.reduce_sentences([go_steps[0].describers[0].get_arg('Arg-PPT')]), "go"):
                     steps, goal = go_steps, go_goal
                     add_can_not(can_not_action_res, goal.args[2])
                 else:
@@ -244,7 +235,7 @@ def compute_policy_steps(policy, item,  can_not_action_res,
     if steps is None:
         if prec_steps is not None:
             steps, goal = prec_steps, prec_goal
-        if len(go_steps) > 0 and desc_mappers.say([go_steps[0].describers[0]]) == go_steps[0] and em_helpers.check_can_not(shelpers.reduce_sentences([go_steps[0].describers[0].get_arg('Arg-PPT')]), "go"):
+        if len(go_steps) > 0 and is_say(go_steps[0]) and em_helpers.check_can_not(shelpers.reduce_sentences([go_steps[0].describers[0].get_arg('Arg-PPT')]), "go"):
             steps, goal = go_steps, go_goal
             add_can_not(can_not_action_res, goal.args[2])
         else:
@@ -260,6 +251,27 @@ def compute_policy_steps(policy, item,  can_not_action_res,
     return steps, goal
 
 
+def be_attribute(entity, neg, attribute):
+    """ Creates the sentence: <entity> is (not) <attribute>
+
+        The sentence is only used to query the knowledge base, so it is created without the language parts.
+    """
+    return tsentences.be((entity, None), ("is", None), (neg, None), (attribute, None))
+
+
+def be_location(player, location):
+    """ Creates the sentence: <player> 's location is in <location>
+
+        The sentence is only used to query the knowledge base, so it is created without the language parts.
+    """
+    return tsentences.be(([player, "'s", 'location'], None), ('is', None), (None, None), (['in', location], None))
+
+
+def lock(entity):
+    """ Locks the entity again. It is used for undoing the temporary unlocking of obstacles and containers. """
+    entity.attributes['locked'] = None
+
+
 def make_item_reachable(player, sloc, tloc, world):
     """ The player's path is cleared of obstacles in order to see if there is another reason
         the player can not act upon the item.
@@ -281,27 +293,22 @@ def make_item_reachable(player, sloc, tloc, world):
 
 
     """
-    if (sloc, tloc) in world.all_paths:
-        dirs = world.all_paths[(sloc, tloc)]
-    else:
-        dirs = []
-
-    for direction in dirs:
+    for direction, path_loc, obs in world.get_resolved_path(sloc, tloc):
         player_loc = player.properties['location'][1]
-        obs = None
-        undo = lambda: None
-        if (direction, 'obstacle') in player_loc.properties:
-            obs = player_loc.properties[(direction, 'obstacle')]
+        if player_loc is not path_loc:
+            # the player did not follow the path, so the obstacle is looked up again.
+            obs = player_loc.properties.get((direction, 'obstacle'))
+        was_locked = False
+        if obs is not None:
             if 'locked' in obs.attributes:
                 del obs.attributes['locked']
-
-                def undo(obstacle=obs):
-                    obstacle.attributes['locked'] = None
+                was_locked = True
 
             if 'type' in obs.properties and obs.properties['type'] == 'door':
                 actions.opens(obs, player, obs.properties['location'][1], obs.properties['location'][0])
         actions.go(player, direction)
-        undo()
+        if was_locked:
+            lock(obs)
 
 
 def open_all_containers(player, item, world):
@@ -323,23 +330,10 @@ def open_all_containers(player, item, world):
         -------
         None
     """
-    curr_loc = item.properties["location"][1]
-    all_locations = [curr_loc]
-
-    while True:
-        if curr_loc == curr_loc.properties['location'][1]:
-            break
-        curr_loc = curr_loc.properties['location'][1]
-
-        all_locations.insert(0, curr_loc)
-
-    for loc in all_locations:
+    for loc in reversed(em_helpers.item_path(item)[1:]):
         if "locked" in loc.attributes:
             del loc.attributes['locked']
-
-            def undo(obs=loc):
-                obs.attributes['locked'] = None
-            world.undo_changes.append(undo)
+            world.undo_changes.append(functools.partial(lock, loc))
 
         if "open" not in loc.attributes:
             actions.opens(loc, player)
@@ -376,14 +370,15 @@ def compute_say_steps(flattened_env_res, orig_env_res, player, knowledge_base):
     """
     steps_checked = []
     steps_not_checked = []
-    for idx, res in enumerate(flattened_env_res):
-        orig_env_res[idx].speaker = player
+    checks = knowledge_base.multi_check_batch(flattened_env_res)
+    for is_checked, env_res in zip(checks, orig_env_res):
+        env_res.speaker = player
         step = tsentences.say(player,
                               None,
                               'says',
-                              orig_env_res[idx],
+                              env_res,
                               speaker=player)
-        if knowledge_base.multi_check(res):
+        if is_checked:
             steps_checked.append(step)
         else:
             steps_not_checked.append(step)
@@ -419,11 +414,23 @@ def extract_reasons(orig_env_res):
         player can not <action> ... <reason_why>
 
     """
-    flattened_res = []
-    for res in orig_env_res:
-        reduced = shelpers.reduce_sentences([res])[1:]
-        flattened_res.append(reduced)
-    return flattened_res
+    return [reduced[1:] for reduced in shelpers.reduce_sentences_each(orig_env_res)]
+
+
+def is_say(sentence):
+    """ Checks whether the sentence is in the form:
+
+            <player> says: <statement>
+
+    """
+    # The say sentence has a single describer, so the sentences with a different number
+    # of describers or with a different verb can be rejected without building it.
+    if len(sentence.describers) != 1:
+        return False
+    rel = sentence.describers[0].get_arg("Rel")
+    if not isinstance(rel, str) or lc.verb_inf(rel.lower()) != "say":
+        return False
+    return desc_mappers.say(sentence.describers) == sentence
 
 
 def find_last_command(dialogue):
@@ -433,7 +440,7 @@ def find_last_command(dialogue):
     dialogue_utterances = dialogue.get_utterances()
     for idx in range(len(dialogue_utterances) - 1, - 1, - 1):
         utter = dialogue_utterances[idx]
-        if desc_mappers.say(utter.describers) == utter:
+        if is_say(utter):
             describer = utter.describers[0]
             sentence = describer.get_arg('Arg-PPT')
             if sentence.trusted_source and sentence == sentence.run_customizer('request_mapping'):
@@ -483,24 +490,24 @@ def check_path(know_base, iloc, directions, dir_idx, tloc):
         If the path is not revealed, a sentence is returned. Otherwise, None is returned.
 
     """
-    if dir_idx >= len(directions):
-        return None
-
-    pkey = directions[dir_idx]
-    pval = iloc.properties[pkey]
-    is_seen = kn_checkers.property_alt_checker(know_base, iloc, pkey, pval, None)
-
-    if is_seen:
-        further_check = check_path(know_base, pval, directions, dir_idx+1, tloc)
-        if further_check is None:
-            return None
-        else:
-            return tsentences.path_reveal(pval, tloc, 'not', 'revealed')
+    second_loc = None
+    for idx in range(dir_idx, len(directions)):
+        pkey = directions[idx]
+        pval = iloc.properties[pkey]
+        if not kn_checkers.property_alt_checker(know_base, iloc, pkey, pval, None):
+            # The sentence refers to the location where the walk stopped if it stopped at the first location.
+            # Otherwise, it refers to the location following the first one.
+            if idx == dir_idx:
+                return tsentences.path_reveal(iloc, tloc, 'not', 'revealed')
+            return tsentences.path_reveal(second_loc, tloc, 'not', 'revealed')
+        if idx == dir_idx:
+            second_loc = pval
+        iloc = pval
 
-    return tsentences.path_reveal(iloc, tloc, 'not', 'revealed')
+    return None
 
 
-def check_loc(know_base, item, item_loc):
+def check_loc(know_base, item, item_loc, memo=None):
     """ Checks whether the agent has seen where the item is located.
         The checking is done recursively so in case the item's location is in a container or another place
         those locations are checked as well.
@@ -513,6 +520,9 @@ def check_loc(know_base, item, item_loc):
             The item that location is checked.
         item_loc : Entity
             The location of the item.
+        memo : dict, optional
+            A dictionary that stores the results of the previous checks, so the locations shared
+            between several items are checked only once. The memo should not outlive the current dialogue turn.
 
         Returns
         -------
@@ -522,18 +532,26 @@ def check_loc(know_base, item, item_loc):
 
 
     """
+    if memo is None:
+        memo = dict()
+    key = (id(item), item_loc[0], id(item_loc[1]))
+    if key in memo:
+        return memo[key]
 
     is_seen = kn_checkers.property_alt_checker(know_base, item, 'location', item_loc, None)
     if item_loc[1] == item and is_seen:
-        return None
-
-    if is_seen:
-        further_check = check_loc(know_base, item_loc[1], item_loc[1].properties["location"])
+        result = None
+    elif is_seen:
+        further_check = check_loc(know_base, item_loc[1], item_loc[1].properties["location"], memo)
         if further_check is None:
-            return None
+            result = None
         else:
-            return item_loc[1]
-    return item
+            result = item_loc[1]
+    else:
+        result = item
+
+    memo[key] = result
+    return result
 
 
 def path_revealed(dialogue, player, sloc, tloc, neg_res):
@@ -571,17 +589,11 @@ def path_revealed(dialogue, player, sloc, tloc, neg_res):
         step = check_path(know_base, sloc, dirs, 0, tloc)
 
     else:
-        path_not_exist = True
-        for direction in dialogue.dia_generator.world.directions:
-            for place in dialogue.dia_generator.world.places:
-                if kn_checkers.elem_exists_alt_checker(know_base, place, direction, None) is None:
-                    path_not_exist = False
-                    break
-
-            if path_not_exist is False:
-                break
-        if path_not_exist:
-            step = tsentences.be((None, lc.Word('There')),
+        path_exists = any(kn_checkers.elem_exists_alt_checker(know_base, place, direction, None) is None
+                          for direction in dialogue.dia_generator.world.directions
+                          for place in dialogue.dia_generator.world.places)
+        if not path_exists:
+            step = tsentences.be((None, WORD_THERE),
                                  'is',
                                  None,
                                  ['no', 'path', 'from', sloc, 'to', tloc]
@@ -631,15 +643,15 @@ def prec_action_item(dialogue,
     """
     know_base = dialogue.dia_generator.knowledge_base
     steps = []
+    memo = dict()
 
     for item in items:
-        item_loc_not_rev = check_loc(know_base, item, item.properties["location"])
+        item_loc_not_rev = check_loc(know_base, item, item.properties["location"], memo)
         if item_loc_not_rev is not None:
             step = tsentences.be([item_loc_not_rev, "'s", 'location'], 'is', 'not', 'revealed')
-            if step not in steps:
-                if neg_response is not None:
-                    step = tsentences.cont([neg_response, step], speaker=player)
-                steps.append(tsentences.say(player, None, 'says', step, speaker=player))
+            if neg_response is not None:
+                step = tsentences.cont([neg_response, step], speaker=player)
+            steps.append(tsentences.say(player, None, 'says', step, speaker=player))
     goal = tgoals.Goal(tgoals.multiple_correct,
                        dialogue,
                        player,
@@ -669,15 +681,15 @@ def reduce_and_check_say(steps, target_sent):
     found_flag : bool
         True if the neg_sent is found in one of the sentences. Otherwise, False.
     """
-    reduced_steps = shelpers.reduce_sentences(steps)
-    found_flag = False
-
-    for rstep in reduced_steps:
-        if len(rstep.describers) == 1:
+    memo = dict()
 
-            if rstep.describers[0].get_arg("Rel") == "says":
-                inner_sent = rstep.describers[0].get_arg("Arg-PPT")
-                if inner_sent == target_sent:
-                    found_flag = True
-                    break
-    return found_flag
+    for step in steps:
+        # The steps are reduced one at a time, so the remaining ones are not reduced once the target is found.
+        for rstep in shelpers.reduce_sentences([step], memo):
+            if len(rstep.describers) == 1:
+
+                if rstep.describers[0].get_arg("Rel") == "says":
+                    inner_sent = rstep.describers[0].get_arg("Arg-PPT")
+                    if inner_sent == target_sent:
+                        return True
+    return False
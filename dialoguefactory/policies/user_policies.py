@@ -4,7 +4,6 @@
 This module lists the user policies that the user uses to respond to the dialogue.
 """
 
-import copy
 from abc import ABC, abstractmethod
 
 from ..language import sentences as tsentences
@@ -12,6 +11,42 @@ from ..language import queries as tqueries
 
 from . import base_policies as bp
 
+# The query function and the name of its item argument for each of the item requests
+# in the format: <agent>, <rel> (a) <item> <location_position> <location>
+ITEM_QUERIES = {"get": (tqueries.get, "entity"),
+                "drop": (tqueries.drop, "entity"),
+                "open": (tqueries.opens, "thing_opened"),
+                "close": (tqueries.close, "thing_closed")}
+
+
+def agent_desc_elements(agent):
+    """
+    Returns the elements of the agent's description without the leading "the".
+    For example, the elements of "the big person" are ("big", "person"), so that
+    the user addresses the agent with "Big person, get the red ball".
+
+    The result is stored in agent.description_elems together with the description it belongs to,
+    so it is recomputed when the agent gets a new description.
+
+    Parameters
+    ----------
+    agent : Entity
+        The agent that the user addresses.
+
+    Returns
+    -------
+    tuple
+        The description elements.
+    """
+    if agent.description_elems is not None and agent.description_elems[0] is agent.description:
+        return agent.description_elems[1]
+
+    agent.describe()
+    elems = agent.description.elements
+    agent_desc_elems = tuple(elems[1:] if len(elems) > 0 and elems[0] == "the" else elems)
+    agent.description_elems = (agent.description, agent_desc_elems)
+    return agent_desc_elems
+
 
 class UserPolicy(bp.Policy, ABC):
     """
@@ -28,6 +63,7 @@ class UserPolicy(bp.Policy, ABC):
         The dialogue where this policy is used. The default is None.
 
     """
+    __slots__ = ()
 
     def execute(self, include_goal=False, **params):
         steps = self.get_steps(**params)
@@ -40,6 +76,39 @@ class UserPolicy(bp.Policy, ABC):
     def get_goal(self, **params):
         return None
 
+    def get_steps(self, **params):
+        """
+        Get the user request in the following format:
+
+            <player> says: <request>
+
+        Returns
+        -------
+        sent : Sentence
+            The user request or None if the request can not be generated.
+        """
+        sent = self.get_inner_steps(**params)
+        if sent is not None:
+            sent = self.wrap_say(sent)
+        return sent
+
+    @abstractmethod
+    def get_inner_steps(self, **params):
+        """
+        Get the user request without the "<player> says:" part.
+        It is used directly when the request is part of another one, like in the AndPolicy.
+
+        Returns
+        -------
+        sent : Sentence
+            The user request or None if the request can not be generated.
+        """
+        pass
+
+    def wrap_say(self, sent):
+        """ Wraps the request into: <player> says: <request> """
+        return tsentences.say(self.player, None, 'says', sent, speaker=self.player)
+
 
 class BaseItemPolicy(UserPolicy, ABC):
     """
@@ -63,13 +132,15 @@ class BaseItemPolicy(UserPolicy, ABC):
         The dialogue that the policy belongs to. The default is None.
 
     """
+    __slots__ = ("item", "agent")
+
     def __init__(self, player, item=None, agent=None, dialogue=None):
         super().__init__(player, dialogue)
         self.item = item
         self.agent = agent
 
     @abstractmethod
-    def generate_response(self, item, agent_desc_elems, tmp):
+    def generate_response(self, item, agent_pair, tmp):
         """
         Generate the user request that the agent has to complete.
 
@@ -77,8 +148,8 @@ class BaseItemPolicy(UserPolicy, ABC):
         ----------
         item : Entity
             The entity that the agent acts upon.
-        agent_desc_elems : list
-            List of elements, property keys, attributes, or other strings for the agent description.
+        agent_pair : tuple
+            The agent and its description (Phrase) used for addressing the agent.
         tmp : tuple
             The tmp element is used for temporal words/phrases. The first element of the tuple
             can be a string or a list and the second one Word or Phrase.
@@ -91,7 +162,7 @@ class BaseItemPolicy(UserPolicy, ABC):
         """
         pass
 
-    def get_steps(self, **params):
+    def get_inner_steps(self, **params):
         """
         Get the user request based on the attributes of this class.
 
@@ -106,19 +177,12 @@ class BaseItemPolicy(UserPolicy, ABC):
 
         sent = None
 
-        player_prev_utters = self.dialogue.get_player_utters(self.player)
-
-        if len(player_prev_utters) < 1:
+        if not self.dialogue.has_player_utters(self.player):
             item = self.item
-            self.agent.describe()
-            agent_desc_elems = copy.copy(self.agent.description.elements)
-            if agent_desc_elems[0] == "the":
-                del agent_desc_elems[0]
+            agent_desc_elems = agent_desc_elements(self.agent)
+            agent_pair = (self.agent, self.agent.describe(agent_desc_elems))
             tmp = params.get("tmp", None)
-            sent = self.generate_response(item, agent_desc_elems, tmp)
-            if sent is not None:
-                sent = tsentences.say(self.player, None, 'says',
-                                      sent, speaker=self.player)
+            sent = self.generate_response(item, agent_pair, tmp)
             self.reset()
         return sent
 
@@ -130,7 +194,7 @@ class BaseItemPolicy(UserPolicy, ABC):
         return self.item, self.agent
 
     def recover_state(self, state):
-        self.item, self.agent = state[0], state[1]
+        self.item, self.agent = state
 
 
 class ActionItemPolicy(BaseItemPolicy, ABC):
@@ -141,22 +205,46 @@ class ActionItemPolicy(BaseItemPolicy, ABC):
         For example, Hans, get the red ball in the kitchen.
 
     """
+    __slots__ = ("location", "location_position")
+
     def __init__(self, player, item=None, agent=None, location=None, location_position=None,  dialogue=None):
         super().__init__(player, item, agent,  dialogue)
         self.location = location
         self.location_position = location_position
 
+    def get_prepos_location(self):
+        """ Returns the location of the item as [location_position, location] or None if the location is not set.
+            A new list is returned because the queries keep it in the sentence.
+        """
+        if self.location is None:
+            return None
+        return [self.location_position, self.location]
+
+    def generate_item_query(self, rel, item, agent_pair, tmp):
+        """ Generates the request: <agent>, <rel> (a) <item> <location_position> <location>
+            using the query function registered for the rel in ITEM_QUERIES.
+        """
+        query_func, item_arg = ITEM_QUERIES[rel]
+        if "abstract" in item.attributes:
+            item = ['a', item]
+
+        return query_func(tmp,
+                          agent_pair,
+                          rel=rel,
+                          prepos_location=self.get_prepos_location(),
+                          speaker=self.player,
+                          **{item_arg: item})
+
     def reset(self):
         super().reset()
         self.location = None
         self.location_position = None
 
     def save_state(self):
-        return super().save_state(), self.location, self.location_position
+        return self.item, self.agent, self.location, self.location_position
 
     def recover_state(self, state):
-        super().recover_state(state[0])
-        self.location, self.location_position = state[1], state[2]
+        self.item, self.agent, self.location, self.location_position = state
 
 
 class GoDirectionPolicy(UserPolicy):
@@ -166,33 +254,28 @@ class GoDirectionPolicy(UserPolicy):
 
         For example, the big person says: John, go north
     """
+    __slots__ = ("agent", "direction")
+
     def __init__(self, player, agent=None, direction=None, dialogue=None):
         super().__init__(player, dialogue)
         self.agent = agent
         self.direction = direction
 
-    def get_steps(self, **params):
+    def get_inner_steps(self, **params):
         sent = None
         if self.agent is None or self.direction is None:
             return None
 
-        player_prev_utters = self.dialogue.get_player_utters(self.player)
-
-        if len(player_prev_utters) < 1:
+        if not self.dialogue.has_player_utters(self.player):
             tmp = params.get("tmp", None)
-            self.agent.describe()
-            agent_desc_elems = copy.copy(self.agent.description.elements)
-            if agent_desc_elems[0] == "the":
-                del agent_desc_elems[0]
-
-            request_go_to_direction = tqueries.go(tmp=tmp,
-                                                  player=(self.agent, self.agent.describe(agent_desc_elems)),
-                                                  rel="go",
-                                                  direction=self.direction,
-                                                  speaker=self.player)
-
-            sent = tsentences.say(self.player, None, 'says',
-                                  request_go_to_direction, speaker=self.player)
+            agent_desc_elems = agent_desc_elements(self.agent)
+            agent_pair = (self.agent, self.agent.describe(agent_desc_elems))
+
+            sent = tqueries.go(tmp=tmp,
+                               player=agent_pair,
+                               rel="go",
+                               direction=self.direction,
+                               speaker=self.player)
             self.reset()
 
         return sent
@@ -205,13 +288,14 @@ class GoDirectionPolicy(UserPolicy):
         return self.agent, self.direction
 
     def recover_state(self, state):
-        self.agent = state[0]
-        self.direction = state[1]
+        self.agent, self.direction = state
 
 
 class GoLocationPolicy(ActionItemPolicy):
     """ The policy for the user request: <agent>, go to (a) item """
-    def generate_response(self, item, agent_desc_elems, tmp):
+    __slots__ = ()
+
+    def generate_response(self, item, agent_pair, tmp):
 
         if "abstract" in item.attributes:
             target_location = ['to', 'a', item]
@@ -219,7 +303,7 @@ class GoLocationPolicy(ActionItemPolicy):
             target_location = ['to', item]
 
         sent = tqueries.go(tmp,
-                           (self.agent, self.agent.describe(agent_desc_elems)),
+                           agent_pair,
                            rel='go',
                            target_location=target_location,
                            speaker=self.player)
@@ -229,50 +313,25 @@ class GoLocationPolicy(ActionItemPolicy):
 
 class GetItemPolicy(ActionItemPolicy):
     """ The policy for the user request: <agent>, get (a) item <location_position> <location>"""
+    __slots__ = ()
 
-    def generate_response(self, item, agent_desc_elems, tmp):
-        if "abstract" in item.attributes:
-            item = ['a', item]
-        if self.location is not None:
-            loc_pos = [self.location_position, self.location]
-        else:
-            loc_pos = None
-
-        sent = tqueries.get(tmp,
-                            (self.agent, self.agent.describe(agent_desc_elems)),
-                            rel='get',
-                            entity=item,
-                            prepos_location=loc_pos,
-                            speaker=self.player)
-
-        return sent
+    def generate_response(self, item, agent_pair, tmp):
+        return self.generate_item_query('get', item, agent_pair, tmp)
 
 
 class DropItemPolicy(ActionItemPolicy):
     """ The policy for the user request: <agent>, drop (a) item <location_position> <location>"""
+    __slots__ = ()
 
-    def generate_response(self, item, agent_desc_elems, tmp):
-        if "abstract" in item.attributes:
-            item = ['a', item]
-
-        if self.location is not None:
-            loc_pos = [self.location_position, self.location]
-        else:
-            loc_pos = None
-
-        sent = tqueries.drop(tmp,
-                             (self.agent, self.agent.describe(agent_desc_elems)),
-                             rel='drop',
-                             entity=item,
-                             prepos_location=loc_pos,
-                             speaker=self.player)
-        return sent
+    def generate_response(self, item, agent_pair, tmp):
+        return self.generate_item_query('drop', item, agent_pair, tmp)
 
 
 class LookItemPolicy(ActionItemPolicy):
     """ The policy for the user request: <agent>, look <location_position> (a) item in <location> """
+    __slots__ = ()
 
-    def generate_response(self, item, agent_desc_elems, tmp):
+    def generate_response(self, item, agent_pair, tmp):
 
         if "abstract" in item.attributes:
             item = ['a', item]
@@ -283,12 +342,12 @@ class LookItemPolicy(ActionItemPolicy):
             loc_pos = None
 
         if isinstance(item, list):
-            item = [self.location_position] + item
+            item = [self.location_position, *item]
         else:
             item = [self.location_position, item]
 
         sent = tqueries.look(tmp,
-                             (self.agent, self.agent.describe(agent_desc_elems)),
+                             agent_pair,
                              rel='look',
                              thing_looked=item,
                              item_location=loc_pos,
@@ -298,58 +357,31 @@ class LookItemPolicy(ActionItemPolicy):
 
 class OpenItemPolicy(ActionItemPolicy):
     """ The policy for the user request: <agent>, open (a) <item> <location_position> <location> """
+    __slots__ = ()
 
-    def generate_response(self, item, agent_desc_elems, tmp):
-
-        if "abstract" in item.attributes:
-            item = ['a', item]
-
-        if self.location is not None:
-            loc_pos = [self.location_position, self.location]
-        else:
-            loc_pos = None
-
-        sent = tqueries.opens(tmp,
-                              (self.agent, self.agent.describe(agent_desc_elems)),
-                              rel='open',
-                              thing_opened=item,
-                              prepos_location=loc_pos,
-                              speaker=self.player)
-        return sent
+    def generate_response(self, item, agent_pair, tmp):
+        return self.generate_item_query('open', item, agent_pair, tmp)
 
 
 class CloseItemPolicy(ActionItemPolicy):
     """ The policy for the user request: <agent>, close (a) item <location_position> <location> """
+    __slots__ = ()
 
-    def generate_response(self, item, agent_desc_elems, tmp):
-
-        if "abstract" in item.attributes:
-            item = ['a', item]
-
-        if self.location is not None:
-            loc_pos = [self.location_position, self.location]
-        else:
-            loc_pos = None
-
-        sent = tqueries.close(tmp,
-                              (self.agent, self.agent.describe(agent_desc_elems)),
-                              rel='close',
-                              thing_closed=item,
-                              prepos_location=loc_pos,
-                              speaker=self.player)
-        return sent
+    def generate_response(self, item, agent_pair, tmp):
+        return self.generate_item_query('close', item, agent_pair, tmp)
 
 
 class ChangePropPolicy(BaseItemPolicy):
     """ The policy for the user request: <agent>, change (a) <item> 's <prop_key> to <new_val>
         For example, Jim change the big container color to red.  """
+    __slots__ = ("prop_key", "new_val")
 
     def __init__(self, player, item=None, agent=None, prop_key=None, new_val=None, dialogue=None):
         super().__init__(player, item, agent, dialogue)
         self.prop_key = prop_key
         self.new_val = new_val
 
-    def generate_response(self, item, agent_desc_elems, tmp):
+    def generate_response(self, item, agent_pair, tmp):
 
         if self.prop_key is None or self.new_val is None:
             return None
@@ -366,14 +398,14 @@ class ChangePropPolicy(BaseItemPolicy):
         else:
             prop_key = [self.prop_key]
         if isinstance(item, list):
-            item = item + ["'s"] + prop_key
+            item = [*item, "'s", *prop_key]
         else:
-            item = [item, "'s"] + prop_key
+            item = [item, "'s", *prop_key]
         sent = tqueries.change(tmp,
-                               (self.agent, self.agent.describe(agent_desc_elems)),
+                               agent_pair,
                                rel='change',
                                thing_changing=item,
-                               end_state=['to'] + new_val,
+                               end_state=['to', *new_val],
                                speaker=self.player)
         return sent
 
@@ -383,11 +415,10 @@ class ChangePropPolicy(BaseItemPolicy):
         self.new_val = None
 
     def save_state(self):
-        return super().save_state(), self.prop_key, self.new_val
+        return self.item, self.agent, self.prop_key, self.new_val
 
     def recover_state(self, state):
-        super().recover_state(state[0])
-        self.prop_key, self.new_val = state[1], state[2]
+        self.item, self.agent, self.prop_key, self.new_val = state
 
 
 class AndPolicy(UserPolicy):
@@ -395,42 +426,40 @@ class AndPolicy(UserPolicy):
 
             <player> says: <agent>, <request_1> and <request_2> and ... <request_n>
 
-        where request_idx comes from executing each of the individual user policies
-        in self.user_policies and extracting the inner sentence.
+        where request_idx is the inner request (see get_inner_steps) of each of the individual user policies
+        in self.user_policies.
     """
+    __slots__ = ("user_policies",)
+
     def __init__(self, player, user_policies=None, dialogue=None):
         super().__init__(player, dialogue)
         self.user_policies = list() if user_policies is None else user_policies
 
-    def get_steps(self, **params):
-        if len(self.user_policies) == 0 or None in self.user_policies:
+    def get_inner_steps(self, **params):
+        if not self.user_policies or any(pol is None for pol in self.user_policies):
             return None
 
         extract_sentences = []
-        player_prev_utters = self.dialogue.get_player_utters(self.player)
         statement = None
         tmp = params.get("tmp", None)
-        if len(player_prev_utters) < 1:
+        if not self.dialogue.has_player_utters(self.player):
             for idx, pol in enumerate(self.user_policies):
                 if idx != 0 or tmp is not None:
                     if tmp is None:
                         tmp = "then"
-                    utter = pol.execute(tmp=tmp)
+                    sent = pol.get_inner_steps(tmp=tmp)
                 else:
-                    utter = pol.execute()
-                if utter.describers[0].get_arg('Rel') == "says":
-                    extract_sentences.append(utter.describers[0].get_arg('Arg-PPT'))
-                    utter.speaker = self.player
-            user_stat = tsentences.cont_and(extract_sentences, speaker=self.player)
-            statement = tsentences.say(self.player, None, 'says',
-                                       user_stat, speaker=self.player)
+                    sent = pol.get_inner_steps()
+                if sent is not None:
+                    extract_sentences.append(sent)
+            statement = tsentences.cont_and(extract_sentences, speaker=self.player)
 
             self.reset()
 
         return statement
 
     def reset(self):
-        del self.user_policies[:]
+        self.user_policies = []
 
     def replace_dialogue(self, new_dialogue):
         self.dialogue = new_dialogue
@@ -438,16 +467,13 @@ class AndPolicy(UserPolicy):
             pol.replace_dialogue(new_dialogue)
 
     def save_state(self):
-        state_pol = []
-        for pol in self.user_policies:
-            state_pol.append(pol.save_state())
-        return copy.copy(self.user_policies), state_pol
+        return tuple(self.user_policies), tuple(pol.save_state() for pol in self.user_policies)
 
     def recover_state(self, state):
-        del self.user_policies[:]
-        self.user_policies.extend(state[0])
-        for idx, pol in enumerate(self.user_policies):
-            pol.recover_state(state[1][idx])
+        user_policies, policies_states = state
+        self.user_policies = list(user_policies)
+        for pol, pol_state in zip(self.user_policies, policies_states):
+            pol.recover_state(pol_state)
 
 
 class IsItemPropertyPolicy(BaseItemPolicy):
@@ -457,12 +483,14 @@ class IsItemPropertyPolicy(BaseItemPolicy):
 
         For example, Andy says: Is the big person's name Andy?
     """
+    __slots__ = ("property_key", "property_val")
+
     def __init__(self, player, agent=None, item=None, property_key=None, property_val=None, dialogue=None):
         super().__init__(player, item, agent, dialogue)
         self.property_key = property_key
         self.property_val = property_val
 
-    def generate_response(self, item, agent_desc_elems, tmp):
+    def generate_response(self, item, agent_pair, tmp):
 
         if self.property_key is None or self.property_val is None:
             return None
@@ -471,17 +499,18 @@ class IsItemPropertyPolicy(BaseItemPolicy):
         else:
             prop_key = [self.property_key]
 
-        topic = [item, "'s"] + prop_key
-
         if 'abstract' in item.attributes:
-            topic.insert(0, 'a')
+            topic = ['a', item, "'s", *prop_key]
+        else:
+            topic = [item, "'s", *prop_key]
 
         statement = tqueries.be(tmp,
-                                (self.agent, self.agent.describe(agent_desc_elems)),
+                                agent_pair,
                                 topic,
                                 "Is",
                                 None,
-                                self.property_val
+                                self.property_val,
+                                speaker=self.player
                                 )
         return statement
 
@@ -491,11 +520,10 @@ class IsItemPropertyPolicy(BaseItemPolicy):
         self.property_val = None
 
     def save_state(self):
-        return super().save_state(), self.property_key, self.property_val
+        return self.item, self.agent, self.property_key, self.property_val
 
     def recover_state(self, state):
-        super().recover_state(state[0])
-        self.property_key, self.property_val = state[1], state[2]
+        self.item, self.agent, self.property_key, self.property_val = state
 
 
 class IsItemAttributePolicy(BaseItemPolicy):
@@ -503,11 +531,13 @@ class IsItemAttributePolicy(BaseItemPolicy):
         <player> says: <agent>, Is (a) <item> <attribute>?
         For example, Andy says: Is the big person static?
     """
+    __slots__ = ("attribute",)
+
     def __init__(self, player, agent=None, item=None, attribute=None, dialogue=None):
         super().__init__(player, item, agent, dialogue)
         self.attribute = attribute
 
-    def generate_response(self, item, agent_desc_elems, tmp):
+    def generate_response(self, item, agent_pair, tmp):
         if self.attribute is None:
             return None
 
@@ -522,11 +552,12 @@ class IsItemAttributePolicy(BaseItemPolicy):
             attr = self.attribute
 
         statement = tqueries.be(tmp,
-                                (self.agent, self.agent.describe(agent_desc_elems)),
+                                agent_pair,
                                 topic,
                                 "Is",
                                 None,
-                                attr
+                                attr,
+                                speaker=self.player
                                 )
         return statement
 
@@ -535,8 +566,7 @@ class IsItemAttributePolicy(BaseItemPolicy):
         self.attribute = None
 
     def save_state(self):
-        return super().save_state(), self.attribute
+        return self.item, self.agent, self.attribute
 
     def recover_state(self, state):
-        super().recover_state(state[0])
-        self.attribute = state[1]
+        self.item, self.agent, self.attribute = state
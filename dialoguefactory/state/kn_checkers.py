@@ -3,13 +3,16 @@
 """
 This module contains the functions that check whether the information exists in the KnowledgeBase.
 """
-import copy
 
 from . import kn_helpers
 from . import kn_parsers
 from ..environment import entities as em
+from ..language import components as lc
 from ..language import sentences as tsentences
 
+# Marks a missing dictionary key, since None can be a stored value.
+MISSING = object()
+
 
 def basic_checker(kb_state, sent):
     """
@@ -30,16 +33,14 @@ def basic_checker(kb_state, sent):
         None is returned if the sentence is not present.
 
     """
-    is_true = None
+    # The basic_updater removes the opposite sentence when adding a sentence, so both can not be present.
+    if kn_helpers.sent_key(sent) in kb_state.sent_db:
+        return True
 
-    if sent in kb_state.sent_db:
-        is_true = True
+    if kn_helpers.oppos_sent_key(sent) in kb_state.sent_db:
+        return False
 
-    oppos_sent = kn_helpers.create_oppos_sent(sent)
-    if oppos_sent in kb_state.sent_db:
-        is_true = False
-
-    return is_true
+    return None
 
 
 def property_checker(kb_state, sent):
@@ -109,11 +110,10 @@ def property_alt_checker(kb_state, ent, pkey, pval, pneg):
         If the information is not visible to the agent in the context, None is returned regardless of the truthfulness.
 
     """
-    if ((pkey is not None and not isinstance(pkey, str) and not isinstance(pkey, tuple))
-            or (pkey is None and not isinstance(pval, str) and not isinstance(pval, tuple))):
+    if not isinstance(pval if pkey is None else pkey, (str, tuple)):
         return None
 
-    world_ent = getattr(kb_state.world, ent.get_property("var_name"), None)
+    world_ent = kb_state.world.var_name_map.get(ent.properties.get("var_name"))
     if world_ent is None:
         return None
 
@@ -122,7 +122,7 @@ def property_alt_checker(kb_state, ent, pkey, pval, pneg):
         if pkey in world_ent.prop_seen:
             result = world_ent.prop_seen[pkey] == pval
         else:
-            if pkey in world_ent.prop_seen_neg and pval in world_ent.prop_seen_neg[pkey]:
+            if pkey in world_ent.prop_seen_neg and lc.prepare_hash(pval) in world_ent.prop_seen_neg[pkey]:
                 result = False
     else:
         if pval in world_ent.attr_seen:
@@ -192,7 +192,7 @@ def elem_exists_alt_checker(kb_state, ent, elem, pneg):
         If the element's existence is not seen by the agent in the context, None is returned.
     """
 
-    world_ent = getattr(kb_state.world, ent.get_property("var_name"), None)
+    world_ent = kb_state.world.var_name_map.get(ent.properties.get("var_name"))
     if world_ent is None:
         return None
 
@@ -237,28 +237,30 @@ def have_checker(kb_state, sent):
         owner, possession, neg, loc = mem
         if loc is None:
             loc = ['in', owner]
-        results = []
         if isinstance(owner, em.Entity):
             if possession == "items" and neg is not None:
                 objs = kb_state.world.obj_list
-            else:
-                if possession is None:
-                    possession = []
-                elif isinstance(possession, set):
-                    possession = list(possession)
-                elif not isinstance(possession, list):
-                    possession = [possession]
+            elif possession is None:
+                objs = ()
+            elif isinstance(possession, (list, set)):
                 objs = possession
+            else:
+                objs = (possession, )
 
+            num_results, all_true, any_false = 0, True, False
             for obj in objs:
                 if not isinstance(obj, em.Entity):
                     return None
                 res = property_alt_checker(kb_state, obj, "location", loc, neg)
-                results.append(res)
-            if len(results) > 0 and all(results):
+                num_results += 1
+                if not res:
+                    all_true = False
+                    if res is False:
+                        any_false = True
+            if num_results > 0 and all_true:
                 is_true = True
 
-            elif False in results:
+            elif any_false:
                 is_true = False
 
     return is_true
@@ -298,29 +300,27 @@ def unique_desc_checker(kb_state, sent):
     if rel.infinitive == 'be':
         topic = desc.get_arg('Arg-PPT')
         comment = desc.get_arg('Arg-PRD')
-        if (isinstance(comment, list) and len(comment) > 2 and comment[0:2] == ["conflicting", "with"]
-                and topic[0:3] == ['The', 'change', 'from'] and topic[5] == 'to'):
+        if (isinstance(comment, list) and len(comment) > 2 and comment[0] == "conflicting" and comment[1] == "with"
+                and isinstance(topic, list) and len(topic) > 5 and topic[0] == 'The' and topic[1] == 'change'
+                and topic[2] == 'from' and topic[5] == 'to'):
             entity = topic[3]
             element_key = topic[4]
             element_val = topic[6:]
             if len(element_val) == 1:
                 element_val = element_val[0]
-            if element_key in entity.properties:
-                old_val = copy.copy(entity.properties[element_key])
-            else:
-                old_val = None
+            old_val = entity.properties.get(element_key, MISSING)
             entity.properties[element_key] = element_val
-            old_seen_val = entity.prop_seen.get(element_key, None)
+            old_seen_val = entity.prop_seen.get(element_key, MISSING)
             entity.prop_seen[element_key] = element_val
             conf_entity = comment[2]
 
             if conf_entity.generate_description(relaxed=False) is None:
                 result = True
-            if old_val is not None:
+            if old_val is not MISSING:
                 entity.properties[element_key] = old_val
             else:
                 del entity.properties[element_key]
-            if old_seen_val is not None:
+            if old_seen_val is not MISSING:
                 entity.prop_seen[element_key] = old_seen_val
             else:
                 del entity.prop_seen[element_key]
@@ -352,21 +352,25 @@ def val_is_key_checker(kb_state, sent):
         if isinstance(arg_prd, list):
             arg_prd = tuple(arg_prd)
 
-        additional_prds = [('player', prop) for prop in ['name', 'nickname', 'surname']]
-        if arg_prd not in kb_state.world.all_properties+['direction']+additional_prds:
+        if arg_prd not in kb_state.world.val_is_key_prds:
             return None
 
         result = None
-        all_keys = []
+        val_seen, prd_seen = False, False
         for obj in kb_state.world.obj_list:
             for key, val in obj.prop_seen.items():
                 if val == arg_ppt:
-                    all_keys.append(key)
-        if len(all_keys) > 0:
+                    val_seen = True
+                    if key == arg_prd:
+                        prd_seen = True
+                        break
+            if prd_seen:
+                break
+        if val_seen:
             if am_neg == 'not':
-                result = not (arg_prd in all_keys)
+                result = not prd_seen
             elif am_neg is None:
-                result = arg_prd in all_keys
+                result = prd_seen
         if result is None:
             result = basic_checker(kb_state, sent)
         return result
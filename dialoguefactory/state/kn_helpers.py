@@ -3,7 +3,11 @@
 """
 This module contains the functions that help implement the functions in the other modules in this folder.
 """
-import copy
+import functools
+
+from ..language import components as lc
+
+NOT_ARG = lc.Arg("not", lc.Word("not"))
 
 
 def create_oppos_sent(sent):
@@ -13,22 +17,41 @@ def create_oppos_sent(sent):
         it might be hard to pinpoint the location where it should be added.
 
     """
-    from ..language import components as lc
-
     desc = sent.describers[0]
     opposite_sent = lc.Sentence()
+    opposite_desc = lc.Describer(args={**desc.args})
     if desc.get_arg("AM-NEG") is None:
-        opposite_sent.describers = [lc.Describer(
-                                                 args=copy.copy(desc.args))]
-        opposite_sent.describers[0].args["AM-NEG"] = lc.Arg("not", lc.Word("not"))
+        opposite_desc.args["AM-NEG"] = NOT_ARG
     else:
-        opposite_sent.describers = [lc.Describer(
-                                                 args=copy.copy(sent.describers[0].args))]
-        if "AM-NEG" in opposite_sent.describers[0].args:
-            del opposite_sent.describers[0].args["AM-NEG"]
+        opposite_desc.args.pop("AM-NEG", None)
+    opposite_sent.describers = [opposite_desc]
     return opposite_sent
 
 
+def sent_key(sent):
+    """
+        Returns the key that represents the sentence in the
+        :attr:`KnowledgeBase.sent_db <dialoguefactory.state.knowledge_base.KnowledgeBase.sent_db>`.
+        The key is a tuple of the frozen describer arguments, so two keys are equal
+        if and only if the sentences are equal (see Sentence.__eq__).
+    """
+    return tuple(frozenset(desc.args.items()) for desc in sent.describers)
+
+
+def oppos_sent_key(sent):
+    """
+        Returns the sent_db key of the opposite sentence (see create_oppos_sent) without creating the sentence.
+        The AM-NEG argument is removed from the first describer if present, or added otherwise.
+    """
+    desc = sent.describers[0]
+    # Like the describer of the opposite sentence, the arguments without a value are pruned.
+    items = [(key, arg) for key, arg in desc.args.items()
+             if key != "AM-NEG" and arg is not None and arg.value is not None]
+    if desc.get_arg("AM-NEG") is None:
+        items.append(("AM-NEG", NOT_ARG))
+    return (frozenset(items), )
+
+
 def check_prop(sent):
     """
     Checks whether the sentence is in one of the following formats:
@@ -73,34 +96,29 @@ def check_prop(sent):
 
 
 def shared_elements(objects, entity, elements=None, only_seen=False, break_first=False):
-    if elements is None:
-        elements = []
-
-    if len(elements) == 0:
+    if not elements:
         return None
 
-    elements = copy.copy(elements)
     if only_seen:
-        elements = [elem for elem in elements if elem in entity.prop_seen or elem in entity.attr_seen]
+        entity_props, entity_attrs = entity.prop_seen, entity.attr_seen
     else:
-        elements = [elem for elem in elements if elem in entity.properties or elem in entity.attributes]
+        entity_props, entity_attrs = entity.properties, entity.attributes
+    elements = [elem for elem in elements if elem in entity_props or elem in entity_attrs]
+    if len(elements) == 0:
+        return []
 
     shared_el = []
     for other in objects:
-        all_elements = []
         if other != entity:
+            if only_seen:
+                other_props, other_attrs = other.prop_seen, other.attr_seen
+            else:
+                other_props, other_attrs = other.properties, other.attributes
+            # The other object is similar only if it shares all elements, so the first differing one ends the check.
             for elem in elements:
-                if only_seen:
-                    if elem in other.prop_seen and entity.prop_seen[elem] == other.prop_seen[elem]:
-                        all_elements.append(elem)
-                    elif elem in other.attr_seen:
-                        all_elements.append(elem)
-                else:
-                    if elem in other.properties and entity.properties[elem] == other.properties[elem]:
-                        all_elements.append(elem)
-                    elif elem in other.attributes:
-                        all_elements.append(elem)
-            if len(elements) > 0 and set(elements).issubset(all_elements):
+                if not ((elem in other_props and entity_props[elem] == other_props[elem]) or elem in other_attrs):
+                    break
+            else:
                 shared_el.extend(elements)
                 if break_first:
                     break
@@ -123,11 +141,12 @@ def find_similar_objs(objects, entity, elem, only_seen=False):
         only_seen indicates whether to look for objects whose element values are observed by the agent.
     """
     similar_objs = []
-    for other in objects:
-        if only_seen:
+    if only_seen:
+        for other in objects:
             if (elem in other.prop_seen and entity.prop_seen[elem] == other.prop_seen[elem]) or elem in other.attr_seen:
                 similar_objs.append(other)
-        else:
+    else:
+        for other in objects:
             if (elem in other.properties and entity.properties[elem] == other.properties[elem]) or elem in other.attributes:
                 similar_objs.append(other)
 
@@ -137,18 +156,19 @@ def find_similar_objs(objects, entity, elem, only_seen=False):
 def add_prop_seen(kb_state, ent, pkey, pval):
     """ If one of the agents observes that the entity's property key equals the property value,
         the (pkey, pval) pair is added to the entity.prop_seen field.
+        The same observation is often repeated (for example, every time a player looks around),
+        so nothing is changed or recorded for undoing if the pair is already present.
     """
     old_val = ent.prop_seen.get(pkey)
+    if old_val is not None and old_val == pval:
+        return
 
     ent.prop_seen[pkey] = pval
 
-    def undo(old_value=old_val, entity=ent, prop_key=pkey):
-        if old_value is None:
-            del entity.prop_seen[prop_key]
-        else:
-            entity.prop_seen[prop_key] = old_value
-
-    kb_state.undo_changes.append(undo)
+    if old_val is None:
+        kb_state.undo_changes.append(functools.partial(ent.prop_seen.pop, pkey))
+    else:
+        kb_state.undo_changes.append(functools.partial(ent.prop_seen.__setitem__, pkey, old_val))
 
 
 def remove_prop_seen(kb_state, ent, pkey):
@@ -158,12 +178,8 @@ def remove_prop_seen(kb_state, ent, pkey):
         it gets removed.
     """
     if pkey in ent.prop_seen:
-        old_val = ent.prop_seen[pkey]
-        del ent.prop_seen[pkey]
-
-        def undo(entity=ent, prop_key=pkey, old_value=old_val):
-            entity.prop_seen[prop_key] = old_value
-        kb_state.undo_changes.append(undo)
+        old_val = ent.prop_seen.pop(pkey)
+        kb_state.undo_changes.append(functools.partial(ent.prop_seen.__setitem__, pkey, old_val))
 
 
 def add_prop_seen_neg(kb_state, ent, pkey, pval):
@@ -172,20 +188,14 @@ def add_prop_seen_neg(kb_state, ent, pkey, pval):
         For example, if Andy's nickname is no longer 'cuddle bunny', it will be written in this field. 
     """
     if pkey not in ent.prop_seen_neg:
-        ent.prop_seen_neg[pkey] = list()
-
-        def undo_set(entity=ent, prop_key=pkey):
-            del entity.prop_seen_neg[prop_key]
-
-        kb_state.undo_changes.append(undo_set)
-
-    if pval not in ent.prop_seen_neg[pkey]:
-        ent.prop_seen_neg[pkey].append(pval)
+        ent.prop_seen_neg[pkey] = dict()
+        kb_state.undo_changes.append(functools.partial(ent.prop_seen_neg.pop, pkey))
 
-        def undo_neg_val(entity=ent, prop_key=pkey, prop_val=pval):
-            entity.prop_seen_neg[prop_key].remove(prop_val)
-
-        kb_state.undo_changes.append(undo_neg_val)
+    neg_vals = ent.prop_seen_neg[pkey]
+    hash_val = lc.prepare_hash(pval)
+    if hash_val not in neg_vals:
+        neg_vals[hash_val] = pval
+        kb_state.undo_changes.append(functools.partial(neg_vals.pop, hash_val))
 
 
 def remove_prop_seen_neg(kb_state, ent, pkey, pval):
@@ -196,13 +206,11 @@ def remove_prop_seen_neg(kb_state, ent, pkey, pval):
     """
 
     if pkey in ent.prop_seen_neg:
-        if pval in ent.prop_seen_neg[pkey]:
-            ent.prop_seen_neg[pkey].remove(pval)
-
-            def undo(prop_val=pval, entity=ent):
-                entity.prop_seen_neg[pkey].append(prop_val)
-
-            kb_state.undo_changes.append(undo)
+        neg_vals = ent.prop_seen_neg[pkey]
+        hash_val = lc.prepare_hash(pval)
+        if hash_val in neg_vals:
+            prop_val = neg_vals.pop(hash_val)
+            kb_state.undo_changes.append(functools.partial(neg_vals.__setitem__, hash_val, prop_val))
 
 
 def add_attr_seen(kb_state, ent, attr, neg):
@@ -221,11 +229,7 @@ def add_attr_seen(kb_state, ent, attr, neg):
 
     if attr not in attr_seen:
         attr_seen[attr] = None
-
-        def undo(attribute=attr, ent_attr_seen=attr_seen):
-            del ent_attr_seen[attribute]
-
-        kb_state.undo_changes.append(undo)
+        kb_state.undo_changes.append(functools.partial(attr_seen.pop, attr))
 
 
 def remove_attr_seen(kb_state, ent, attr, neg):
@@ -242,8 +246,29 @@ def remove_attr_seen(kb_state, ent, attr, neg):
 
     if attr in attr_seen:
         del attr_seen[attr]
+        kb_state.undo_changes.append(functools.partial(attr_seen.__setitem__, attr, None))
+
 
-        def undo(attribute=attr, ent_attr_seen=attr_seen):
-            ent_attr_seen[attribute] = None
+def swap_elem(elem, add_to, discard_from):
+    """ Adds the element to the set add_to and discards it from the set discard_from. """
+    add_to.add(elem)
+    discard_from.discard(elem)
 
-        kb_state.undo_changes.append(undo)
+
+def move_elem(kb_state, elem, add_to, discard_from):
+    """ Adds the element to the set add_to and removes it from the set discard_from.
+        It is used for the :attr:`ent.elem_exists <dialoguefactory.environment.entities.Entity.elem_exists>`
+        and :attr:`ent.elem_not_exists <dialoguefactory.environment.entities.Entity.elem_not_exists>` pair.
+        When the element changes both sets, a single change is recorded for undoing.
+    """
+    added = elem not in add_to
+    removed = elem in discard_from
+    if added and removed:
+        swap_elem(elem, add_to, discard_from)
+        kb_state.undo_changes.append(functools.partial(swap_elem, elem, discard_from, add_to))
+    elif added:
+        add_to.add(elem)
+        kb_state.undo_changes.append(functools.partial(add_to.discard, elem))
+    elif removed:
+        discard_from.discard(elem)
+        kb_state.undo_changes.append(functools.partial(discard_from.add, elem))
@@ -8,6 +8,15 @@ from ..language import components as lc
 from ..environment import entities as em
 
 
+def is_have(sent):
+    """
+    Checks whether the sentence is a have sentence in the present tense.
+    It is shared by the have_parse and the elem_exists_parse.
+    """
+    return (desc_mappers.have(sent.describers) == sent
+            and lc.verb_tense(sent.describers[0].get_arg("Rel")) in lc.PRESENT_TENSES)
+
+
 def have_parse(sent):
     """
     Extracts the constituent arguments of one of the following sentences:
@@ -19,8 +28,7 @@ def have_parse(sent):
     The (neg) is optional and refers to the negation 'not'.
 
     """
-    if (desc_mappers.have(sent.describers) == sent
-            and lc.verb_tense(sent.describers[0].get_arg("Rel")) in lc.PRESENT_TENSES):
+    if is_have(sent):
         describer = sent.describers[0]
         owner = describer.get_arg("Arg-PAG")
         if not isinstance(owner, em.Entity):
@@ -51,8 +59,7 @@ def elem_exists_parse(sent):
 
     The (neg) is optional and refers to the negation 'not'.
     """
-    if (desc_mappers.have(sent.describers) == sent
-            and lc.verb_tense(sent.describers[0].get_arg("Rel")) in lc.PRESENT_TENSES):
+    if is_have(sent):
         describer = sent.describers[0]
         ent = describer.get_arg("Arg-PAG")
         elem = describer.get_arg("Arg-PPT")
@@ -3,6 +3,7 @@
 """
 This module contains the functions that update the KnowledgeBase.
 """
+import functools
 
 from ..language import components as lc
 from ..language import describers as tdescribers
@@ -13,6 +14,19 @@ from . import kn_parsers
 
 from ..environment import entities as em
 
+cached_verb_info = {}
+
+
+def verb_info(rel):
+    """ Returns the infinitive of the verb rel and whether it is in the present tense.
+        The verb is checked by every verb updater, so the result is cached in cached_verb_info.
+    """
+    info = cached_verb_info.get(rel)
+    if info is None:
+        info = (lc.verb_inf(rel.lower()), lc.verb_tense(rel) in lc.PRESENT_TENSES)
+        cached_verb_info[rel] = info
+    return info
+
 
 def basic_updater(kb_state, sent):
     """
@@ -32,22 +46,15 @@ def basic_updater(kb_state, sent):
 
     """
 
-    if sent not in kb_state.sent_db:
-        kb_state.sent_db.add(sent)
-
-        def undo_add(know_base=kb_state, sentence=sent):
-            know_base.sent_db.discard(sentence)
-
-        kb_state.undo_changes.append(undo_add)
+    key = kn_helpers.sent_key(sent)
+    if key not in kb_state.sent_db:
+        kb_state.sent_db.add(key)
+        kb_state.undo_changes.append(functools.partial(kb_state.sent_db.discard, key))
 
-    opposite_sent = kn_helpers.create_oppos_sent(sent)
-    if opposite_sent in kb_state.sent_db:
-        kb_state.sent_db.remove(opposite_sent)
-
-        def undo_remove(know_base=kb_state, sentence=opposite_sent):
-            know_base.sent_db.add(sentence)
-
-        kb_state.undo_changes.append(undo_remove)
+    opposite_key = kn_helpers.oppos_sent_key(sent)
+    if opposite_key in kb_state.sent_db:
+        kb_state.sent_db.remove(opposite_key)
+        kb_state.undo_changes.append(functools.partial(kb_state.sent_db.add, opposite_key))
 
 
 def property_updater(kb_state, sent):
@@ -83,9 +90,11 @@ def property_updater(kb_state, sent):
     mem = kn_helpers.check_prop(sent)
     if mem is not None:
         ent, pkey, pval, pneg = mem
-        property_update_alt(kb_state, ent, pkey, pval, pneg)
-
-        ent = getattr(kb_state.world, ent.get_property("var_name"), None)
+        world_ent = property_update_alt(kb_state, ent, pkey, pval, pneg)
+        if world_ent is None:
+            # property_update_alt only resolves the Entity-s.
+            world_ent = kb_state.world.var_name_map.get(ent.properties.get("var_name"))
+        ent = world_ent
         if ent is not None:
             if pkey is None:
                 if pval == 'locked' and pneg is None and 'locked' in ent.attributes:
@@ -94,7 +103,7 @@ def property_updater(kb_state, sent):
                 if pkey == 'type' and pneg is None and ent.properties['type'] == pval:
                     if 'place' in ent.attributes:
                         if 'location' in ent.properties:
-                            property_update_alt(kb_state, ent, "location", ent.properties['location'], None)
+                            location_update_alt(kb_state, ent, ent.properties['location'])
     return None
 
 
@@ -130,11 +139,13 @@ def property_update_alt(kb_state, ent, pkey, pval, pneg):
 
     Returns
     -------
-    None.
+    world_ent : Entity or None
+        The entity from kb_state.world, whether or not the observation is valid.
+        None is returned if ent is not an Entity of the world.
 
     """
     if isinstance(ent, em.Entity):
-        world_ent = getattr(kb_state.world, ent.get_property("var_name"), None)
+        world_ent = kb_state.world.var_name_map.get(ent.properties.get("var_name"))
     else:
         world_ent = None
 
@@ -146,7 +157,7 @@ def property_update_alt(kb_state, ent, pkey, pval, pneg):
         if not ((isinstance(pkey, str) or isinstance(pkey, tuple)) and pkey in world_ent.properties
                 and ((pneg is None and world_ent.properties[pkey] == pval)
                      or (pneg is not None and world_ent.properties[pkey] != pval))):
-            return None
+            return world_ent
 
         if pneg is None:
             kn_helpers.add_prop_seen(kb_state, world_ent, pkey, pval)
@@ -159,7 +170,7 @@ def property_update_alt(kb_state, ent, pkey, pval, pneg):
     else:
         if not ((isinstance(pval, str) or isinstance(pval, tuple))
                 and ((pneg is None and pval in ent.attributes) or (pneg is not None and pval not in ent.attributes))):
-            return None
+            return world_ent
 
         if pneg is None:
             kn_helpers.add_attr_seen(kb_state, world_ent, pval, None)
@@ -168,6 +179,35 @@ def property_update_alt(kb_state, ent, pkey, pval, pneg):
         else:
             kn_helpers.add_attr_seen(kb_state, world_ent, pval, pneg)
             kn_helpers.remove_attr_seen(kb_state, world_ent, pval, None)
+    return world_ent
+
+
+def location_update_alt(kb_state, ent, location):
+    """
+    Marks the entity's location as observed. It is the same as
+    property_update_alt(kb_state, ent, "location", location, None), but without
+    the checks of the property key and the negation, since the updaters mostly observe locations.
+
+    Parameters
+    ----------
+    kb_state : KnowledgeBase
+        The knowledge base is used to fetch the world.
+    ent : Entity
+        The entity whose location is observed.
+    location : list
+        The observed location, for example ['in', barn].
+
+    Returns
+    -------
+    None.
+
+    """
+    if isinstance(ent, em.Entity):
+        world_ent = kb_state.world.var_name_map.get(ent.properties.get("var_name"))
+        if (world_ent is not None and "location" in world_ent.properties
+                and world_ent.properties["location"] == location):
+            kn_helpers.add_prop_seen(kb_state, world_ent, "location", location)
+            kn_helpers.remove_prop_seen_neg(kb_state, world_ent, "location", location)
     return None
 
 
@@ -210,7 +250,7 @@ def elem_exists_alt_updater(kb_state, ent, elem, pneg):
     None.
 
     """
-    world_ent = getattr(kb_state.world, ent.get_property("var_name"), None)
+    world_ent = kb_state.world.var_name_map.get(ent.properties.get("var_name"))
     if world_ent is None:
         return None
     cond = False
@@ -221,35 +261,9 @@ def elem_exists_alt_updater(kb_state, ent, elem, pneg):
     if cond:
 
         if pneg is None:
-            if elem not in world_ent.elem_exists:
-                world_ent.elem_exists.add(elem)
-
-                def undo_exists(entity=world_ent, element=elem):
-                    entity.elem_exists.discard(element)
-
-                kb_state.undo_changes.append(undo_exists)
-
-            if elem in world_ent.elem_not_exists:
-                world_ent.elem_not_exists.discard(elem)
-
-                def undo_not_exists(entity=world_ent, element=elem):
-                    entity.elem_not_exists.add(element)
-                kb_state.undo_changes.append(undo_not_exists)
-
+            kn_helpers.move_elem(kb_state, elem, world_ent.elem_exists, world_ent.elem_not_exists)
         else:
-            if elem not in world_ent.elem_not_exists:
-                world_ent.elem_not_exists.add(elem)
-
-                def undo_not_exists(entity=world_ent, element=elem):
-                    entity.elem_not_exists.discard(element)
-                kb_state.undo_changes.append(undo_not_exists)
-
-            if elem in world_ent.elem_exists:
-                world_ent.elem_exists.discard(elem)
-
-                def undo_elem_exists(entity=world_ent, element=elem):
-                    entity.elem_exists.add(element)
-                kb_state.undo_changes.append(undo_elem_exists)
+            kn_helpers.move_elem(kb_state, elem, world_ent.elem_not_exists, world_ent.elem_exists)
 
     return None
 
@@ -289,18 +303,18 @@ def have_updater(kb_state, sent):
         for obj in all_objects:
             property_update_alt(kb_state, obj, "location", loc, "not")
     else:
-        if isinstance(possession, set):
-            possession = list(possession)
-        elif not isinstance(possession, list):
-            possession = [possession]
+        if not isinstance(possession, (list, set)):
+            possession = (possession, )
 
         for obj in possession:
             property_update_alt(kb_state, obj, "location", loc, neg)
 
         if neg is None:
+            # The entities are equal if they have the same var_name (see Entity.__eq__).
+            possession_names = {obj.properties['var_name'] for obj in possession if isinstance(obj, em.Entity)}
             all_objects = kb_state.world.obj_list
             for obj in all_objects:
-                if obj not in possession:
+                if obj.properties['var_name'] not in possession_names:
                     property_update_alt(kb_state, obj,  "location", loc, "not")
 
 
@@ -334,7 +348,7 @@ def go_updater(kb_state, sent):
         describer = sent.describers[0]
         rel = describer.get_arg("Rel")
 
-        if lc.verb_inf(rel.lower()) == "go" and lc.verb_tense(rel) in lc.PRESENT_TENSES:
+        if verb_info(rel) == ("go", True):
             player = describer.get_arg("Arg-PPT")
             direction = describer.get_arg("AM-DIR")
             start_point = describer.get_arg("Arg-DIR")
@@ -348,7 +362,7 @@ def go_updater(kb_state, sent):
                 player_look = sent.describers[1].get_arg("Arg-PPT")
                 thing_looked = sent.describers[1].get_arg("Arg-GOL")
                 rel_look = sent.describers[1].get_arg("Rel")
-                if lc.verb_inf(rel_look.lower()) == "look" and lc.verb_tense(rel_look) in lc.PRESENT_TENSES:
+                if verb_info(rel_look) == ("look", True):
                     look_desc = tdescribers.look((player_look, None), (None, None), (None, None),
                                                  (rel_look, None), (thing_looked, None))
                     if (look_desc == sent.describers[1] and player == player_look and isinstance(direction, str)
@@ -357,7 +371,7 @@ def go_updater(kb_state, sent):
                             property_update_alt(kb_state, start_point[-1], direction,
                                                 start_point[1].properties[direction], None)
 
-                        property_update_alt(kb_state, player, "location", thing_looked, None)
+                        location_update_alt(kb_state, player, thing_looked)
     return None
 
 
@@ -388,19 +402,17 @@ def get_updater(kb_state, sent):
         describer = sent.describers[0]
         rel = describer.get_arg("Rel")
 
-        if lc.verb_inf(rel.lower()) != "get" or lc.verb_tense(rel) not in lc.PRESENT_TENSES:
+        if verb_info(rel) != ("get", True):
             return
 
         player = describer.get_arg("Arg-PAG")
         thing_gotten = describer.get_arg("Arg-PPT")
         giver = describer.get_arg("Arg-DIR")
-        mapped_sent = lc.Sentence()
         mapped_desc = tdescribers.get((player, None), (None, None), (None, None), (rel, None),
                                       (thing_gotten, None), (giver, None))
-        mapped_sent.describers.append(mapped_desc)
-        if mapped_sent == sent:
-            if all(map(isinstance, [player, thing_gotten], [em.Entity, em.Entity])):
-                property_update_alt(kb_state, thing_gotten, "location", ["in", player], None)
+        if len(sent.describers) == 1 and mapped_desc == describer:
+            if isinstance(player, em.Entity) and isinstance(thing_gotten, em.Entity):
+                location_update_alt(kb_state, thing_gotten, ["in", player])
 
 
 def drop_updater(kb_state, sent):
@@ -417,22 +429,20 @@ def drop_updater(kb_state, sent):
         describer = sent.describers[0]
         rel = describer.get_arg("Rel")
 
-        if lc.verb_inf(rel.lower()) != "drop" or lc.verb_tense(rel) not in lc.PRESENT_TENSES:
+        if verb_info(rel) != ("drop", True):
             return
 
         player = describer.get_arg("Arg-PAG")
         thing_dropped = describer.get_arg("Arg-PPT")
         location = describer.get_arg("Arg-GOL")
-        mapped_sent = lc.Sentence()
         mapped_desc = tdescribers.drop((player, None), (None, None), (None, None), (rel, None),
                                        (thing_dropped, None), (location, None))
-        mapped_sent.describers.append(mapped_desc)
-        if mapped_sent == sent:
-            if (all(map(isinstance, [player, thing_dropped, location], [em.Entity, em.Entity, list]))
+        if len(sent.describers) == 1 and mapped_desc == describer:
+            if (isinstance(player, em.Entity) and isinstance(thing_dropped, em.Entity) and isinstance(location, list)
                     and len(location) == 2 and isinstance(location[-1], em.Entity)
                     and location[-2] in kb_state.world.location_positions):
                 for ent in [player, thing_dropped]:
-                    property_update_alt(kb_state, ent, "location", location, None)
+                    location_update_alt(kb_state, ent, location)
 
 
 def see_updater(kb_state, sent):
@@ -444,34 +454,59 @@ def see_updater(kb_state, sent):
             <player> sees <entity_1>, ... , <entity_n> <at_location>
 
     """
-    if len(sent.describers) > 0:
-        describer = sent.describers[0]
-        rel = describer.get_arg("Rel")
+    if len(sent.describers) == 1:
+        see_describer_updater(kb_state, sent.describers[0])
 
-        if lc.verb_inf(rel.lower()) != "see" or lc.verb_tense(rel) not in lc.PRESENT_TENSES:
-            return
 
-        player = describer.get_arg("Arg-PAG")
-        things_seen = describer.get_arg("Arg-PPT")
+def see_describer_updater(kb_state, describer, location=None):
+    """
+    Does the update of the see_updater for a single describer.
+
+    Parameters
+    ----------
+    kb_state : KnowledgeBase
+        The knowledge base.
+    describer : Describer
+        The describer of the see sentence.
+    location : list, optional
+        The location that is used if the describer does not have an AM-LOC argument.
+        For example, in the sentence "Andy looks in the barn. He sees the small ball.",
+        the location of the second describer is ['in', barn].
+        The describer itself is not changed.
+
+    Returns
+    -------
+    None.
+
+    """
+    rel = describer.get_arg("Rel")
+
+    if verb_info(rel) != ("see", True):
+        return
+
+    player = describer.get_arg("Arg-PAG")
+    things_seen = describer.get_arg("Arg-PPT")
+    desc_args = describer.args
+    if location is None or describer.get_arg("AM-LOC") is not None:
         location = describer.get_arg("AM-LOC")
+    else:
+        desc_args = {**desc_args, "AM-LOC": lc.Arg(location)}
 
-        mapped_sent = lc.Sentence()
-        mapped_desc = tdescribers.see((player, None), (None, None), (rel, None),
-                                      (things_seen, None), (location, None))
-        mapped_sent.describers.append(mapped_desc)
-        if mapped_sent == sent:
-            if isinstance(things_seen, set):
-                things_seen = list(things_seen)
-            elif not isinstance(things_seen, (set, tuple, list)):
-                things_seen = [things_seen]
-            if (isinstance(player, em.Entity)
-                    and isinstance(location, list)
-                    and len(location) == 2
-                    and isinstance(location[-1], em.Entity)
-                    and location[-2] in kb_state.world.location_positions):
+    mapped_desc = tdescribers.see((player, None), (None, None), (rel, None),
+                                  (things_seen, None), (location, None))
+    if mapped_desc.args == desc_args:
+        if isinstance(things_seen, set):
+            things_seen = list(things_seen)
+        elif not isinstance(things_seen, (set, tuple, list)):
+            things_seen = [things_seen]
+        if (isinstance(player, em.Entity)
+                and isinstance(location, list)
+                and len(location) == 2
+                and isinstance(location[-1], em.Entity)
+                and location[-2] in kb_state.world.location_positions):
 
-                for ent in things_seen + [player]:
-                    property_update_alt(kb_state, ent, "location", location, None)
+            for ent in things_seen + [player]:
+                location_update_alt(kb_state, ent, location)
 
 
 def look_updater(kb_state, sent):
@@ -488,7 +523,7 @@ def look_updater(kb_state, sent):
         describer = sent.describers[0]
         rel = describer.get_arg("Rel")
 
-        if lc.verb_inf(rel.lower()) != "look" or lc.verb_tense(rel) not in lc.PRESENT_TENSES:
+        if verb_info(rel) != ("look", True):
             return
         player = describer.get_arg("Arg-PPT")
         thing_looked = describer.get_arg("Arg-GOL")
@@ -498,20 +533,11 @@ def look_updater(kb_state, sent):
 
             if (isinstance(thing_looked, list)
                     and thing_looked[0] in kb_state.world.location_positions
-                    and all(map(isinstance, [thing_looked[1], player], [em.Entity, em.Entity]))):
+                    and isinstance(thing_looked[1], em.Entity) and isinstance(player, em.Entity)):
                 for ent in [player, thing_looked[1]]:
-                    property_update_alt(kb_state, ent, "location", thing_looked, None)
+                    location_update_alt(kb_state, ent, thing_looked)
             if len(sent.describers) == 2:
-                added = False
-                if sent.describers[1].get_arg("AM-LOC") is None:
-                    sent.describers[1].args["AM-LOC"] = lc.Arg(thing_looked)
-                    added = True
-                see_sent = lc.Sentence()
-                see_sent.describers.append(sent.describers[1])
-                see_updater(kb_state, see_sent)
-
-                if added:
-                    del sent.describers[1].args["AM-LOC"]
+                see_describer_updater(kb_state, sent.describers[1], thing_looked)
 
 
 def opens_updater(kb_state, sent):
@@ -527,18 +553,16 @@ def opens_updater(kb_state, sent):
         describer = sent.describers[0]
         rel = describer.get_arg("Rel")
 
-        if lc.verb_inf(rel.lower()) != "open" or lc.verb_tense(rel) not in lc.PRESENT_TENSES:
+        if verb_info(rel) != ("open", True):
             return
 
         opener = describer.get_arg("Arg-PAG")
         thing_opened = describer.get_arg("Arg-PPT")
 
-        mapped_sent = lc.Sentence()
         mapped_desc = tdescribers.opens((opener, None), (None, None), (None, None),
                                         (rel, None), (thing_opened, None))
-        mapped_sent.describers.append(mapped_desc)
-        if mapped_sent == sent:
-            if all(map(isinstance, [opener, thing_opened], [em.Entity, em.Entity])):
+        if len(sent.describers) == 1 and mapped_desc == describer:
+            if isinstance(opener, em.Entity) and isinstance(thing_opened, em.Entity):
                 property_update_alt(kb_state, thing_opened, None, "open", None)
                 property_update_alt(kb_state, thing_opened, None, "openable", None)
 
@@ -556,22 +580,57 @@ def close_updater(kb_state, sent):
         describer = sent.describers[0]
         rel = describer.get_arg("Rel")
 
-        if lc.verb_inf(rel.lower()) != "close" or lc.verb_tense(rel) not in lc.PRESENT_TENSES:
+        if verb_info(rel) != ("close", True):
             return
         closer = describer.get_arg("Arg-PAG")
         thing_closed = describer.get_arg("Arg-PPT")
         location = describer.get_arg("AM-LOC")
 
-        mapped_sent = lc.Sentence()
         mapped_desc = tdescribers.close((closer, None), (None, None), (None, None),
                                         (rel, None), (thing_closed, None), (location, None))
-        mapped_sent.describers.append(mapped_desc)
-        if mapped_sent == sent:
-            if all(map(isinstance, [closer, thing_closed], [em.Entity, em.Entity])):
+        if len(sent.describers) == 1 and mapped_desc == describer:
+            if isinstance(closer, em.Entity) and isinstance(thing_closed, em.Entity):
                 property_update_alt(kb_state, thing_closed, None, "open", "not")
                 property_update_alt(kb_state, thing_closed, None, "openable", None)
 
 
+VERB_UPDATERS = {"look": look_updater,
+                 "see": see_updater,
+                 "go": go_updater,
+                 "get": get_updater,
+                 "drop": drop_updater,
+                 "open": opens_updater,
+                 "close": close_updater}
+
+
+def verb_updater(kb_state, sent):
+    """
+    Calls the updater of the sentence's verb from VERB_UPDATERS if the verb is in the present tense.
+    Each of these updaters accepts a single verb, so the verb is looked up once
+    instead of calling all of them one after another.
+
+    Parameters
+    ----------
+    kb_state : KnowledgeBase
+        The knowledge base.
+    sent : Sentence
+        The sentence whose verb decides the updater.
+
+    Returns
+    -------
+    None.
+
+    """
+    if len(sent.describers) > 0:
+        rel = sent.describers[0].get_arg("Rel")
+        if rel is None:
+            return None
+        verb_infinitive, is_present = verb_info(rel)
+        if is_present and verb_infinitive in VERB_UPDATERS:
+            VERB_UPDATERS[verb_infinitive](kb_state, sent)
+    return None
+
+
 def change_updater(kb_state, sent):
     """
 
@@ -622,8 +681,7 @@ def val_is_key_updater(kb_state, sent):
             return None
         if isinstance(arg_prd, list):
             arg_prd = tuple(arg_prd)
-        additional_prds = [('player', prop) for prop in ['name', 'nickname', 'surname']]
-        if arg_prd not in kb_state.world.all_properties+['direction']+additional_prds:
+        if arg_prd not in kb_state.world.val_is_key_prds:
             return None
         kn_checked = kb_state.world.check_val_is_key(arg_prd, arg_ppt)
         if kn_checked is True:
@@ -634,6 +692,41 @@ def val_is_key_updater(kb_state, sent):
                 basic_updater(kb_state, sent)
 
 
+cached_permit_sents = []
+
+
+def permit_sents():
+    """ Returns the sentences accepted by the permit_updater. The sentences are built once,
+        on the first call, and cached in cached_permit_sents.
+    """
+    if len(cached_permit_sents) == 0:
+        getting_players = tsentences.permit(tsentences.get(rel=("getting", None), entity=("players", None)),
+                                            neg=("not", None), rel=("permitted", None))
+
+        def gen_permit_sent(element_key):
+            changing_elem_key = tsentences.permit(action_allowed=tsentences.change(rel=("changing", None),
+                                                                                   thing_changing=(
+                                                                                   ['the', 'item', "'s", element_key],
+                                                                                   None)),
+                                                  rel=("permitted", None))
+
+            if_item_player = tsentences.be((['if', 'item'], None), ('is', None), (None, None),
+                                           (['in', 'player'], None))
+            changing_elem_key.describers[0].args['AM-ADV'] = lc.Arg(if_item_player, if_item_player)
+            changing_elem_key.parts.append(if_item_player)
+            return changing_elem_key
+
+        changing_permit_sents = [gen_permit_sent("color"), gen_permit_sent("size")]
+        dropping_items = tsentences.drop(rel=("dropping", None),
+                                         entity=(["the", "item", "in", "on", "or", "under", "itself"], None),
+                                         )
+        dropping_not_permitted = tsentences.permit(action_allowed=dropping_items,
+                                                   neg=("not", None),
+                                                   rel=("permitted", None))
+        cached_permit_sents.extend([getting_players]+changing_permit_sents+[dropping_not_permitted])
+    return cached_permit_sents
+
+
 def permit_updater(kb_state, sent):
     """ Adds one of the following sentences in the database:
 
@@ -648,29 +741,5 @@ def permit_updater(kb_state, sent):
         describer = sent.describers[0]
         rel = describer.get_arg("Rel")
         if rel == 'permitted':
-            getting_players = tsentences.permit(tsentences.get(rel=("getting", None), entity=("players", None)),
-                                                neg=("not", None), rel=("permitted", None))
-
-            def gen_permit_sent(element_key):
-                changing_elem_key = tsentences.permit(action_allowed=tsentences.change(rel=("changing", None),
-                                                                                       thing_changing=(
-                                                                                       ['the', 'item', "'s", element_key],
-                                                                                       None)),
-                                                      rel=("permitted", None))
-
-                if_item_player = tsentences.be((['if', 'item'], None), ('is', None), (None, None),
-                                               (['in', 'player'], None))
-                changing_elem_key.describers[0].args['AM-ADV'] = lc.Arg(if_item_player, if_item_player)
-                changing_elem_key.parts.append(if_item_player)
-                return changing_elem_key
-
-            changing_permit_sents = [gen_permit_sent("color"), gen_permit_sent("size")]
-            dropping_items = tsentences.drop(rel=("dropping", None),
-                                             entity=(["the", "item", "in", "on", "or", "under", "itself"], None),
-                                             )
-            dropping_not_permitted = tsentences.permit(action_allowed=dropping_items,
-                                                       neg=("not", None),
-                                                       rel=("permitted", None))
-
-            if sent in [getting_players]+changing_permit_sents+[dropping_not_permitted]:
+            if sent in permit_sents():
                 basic_updater(kb_state, sent)
@@ -32,10 +32,13 @@ class KnowledgeBase:
         The world is used in the updaters.
     undo_changes : list
         A list of changes made by the updaters to the sent_db and the fields mentioned above.
+        Each change is a callable without arguments that reverses it, usually a functools.partial
+        of the bound dict method that restores the entity field.
     last_context_id : int
         The last point in the meta context is used by the updaters to update the knowledge set.
     sent_db : set
-        A list of factual sentences. This field is used by the kn_updaters.basic_updater.
+        A set of factual sentences, each one stored by its key (see kn_helpers.sent_key).
+        This field is used by the kn_updaters.basic_updater.
     updaters : list
         A list of functions that update the knowledge base.
     checkers : list
@@ -54,13 +57,7 @@ class KnowledgeBase:
         self.sent_db = set() if sent_db is None else sent_db
         self.updaters = [kn_updaters.property_updater,
                          kn_updaters.have_updater,
-                         kn_updaters.look_updater,
-                         kn_updaters.see_updater,
-                         kn_updaters.go_updater,
-                         kn_updaters.get_updater,
-                         kn_updaters.drop_updater,
-                         kn_updaters.opens_updater,
-                         kn_updaters.close_updater,
+                         kn_updaters.verb_updater,
                          kn_updaters.elem_exists_updater,
                          kn_updaters.change_updater,
                          kn_updaters.permit_updater] if updaters is None else updaters
@@ -80,6 +77,11 @@ class KnowledgeBase:
         if last_num_elems < 0:
             last_num_elems = len(self.context)
 
+        # The knowledge base is updated before every check, mostly without new sentences in the context.
+        if last_num_elems == 0:
+            self.last_context_id = len(self.context)
+            return
+
         addition = self.context.get(last_num_elems)
         addition = [sent for sent in addition if len(sent.describers) > 0 and sent.describers[0].get_arg("Rel") is not None]
         self.multi_update(addition)
@@ -98,25 +100,33 @@ class KnowledgeBase:
         for updater in self.updaters:
             updater(self, sent)
 
-    def multi_check(self, sents):
+    def multi_check(self, sents, update_context=True):
         """ Checks the sentences against the knowledge base for their validity.
             A sentence is valid if it's factual, and it is observed by the agent.
             If all of them are valid, return True. If at least one of them is not valid, return False.
             Otherwise, return None (unknown validity)
         """
-        self.context_update()
-        checks = []
-        for sent in sents:
-            checks.append(self.check(sent, False))
+        if update_context:
+            self.context_update()
 
-        is_true = None
-        if all(checks):
-            is_true = True
-        elif False in checks:
-            is_true = False
+        # A single invalid sentence decides the result, so the remaining sentences are not checked.
+        is_true = True
+        for sent in sents:
+            res = self.check(sent, False)
+            if res is False:
+                return False
+            if not res:
+                is_true = None
 
         return is_true
 
+    def multi_check_batch(self, sents_list):
+        """ Runs multi_check for each list of sentences in sents_list.
+            The knowledge base is updated with the unseen sentences only once for the whole batch.
+        """
+        self.context_update()
+        return [self.multi_check(sents, False) for sents in sents_list]
+
     def check(self, sent, update_context=True):
         """ Checks the validity of a single sentence against the knowledge base.
             A sentence is valid if it's factual, and it is observed by the agent.
@@ -268,7 +268,8 @@ def compute_loss(model, batch_x, batch_y, input_voc, output_voc, max_len, enc_hi
     _, logits, enc_hid_state = model.translate(batch_x, enc_hid_state, output_voc.bos_ix,
                                                input_voc.eos_ix, max_len, greedy=True)
     logprobs = F.log_softmax(logits, dim=-1)
-    nll = - torch.sum(logprobs * to_one_hot(batch_y, len(output_voc)), dim=-1)
+    # Selecting the log-probability of the correct output equals the sum with its one-hot vector.
+    nll = - logprobs.gather(-1, batch_y.unsqueeze(-1)).squeeze(-1)
     mask = infer_mask(batch_y, output_voc.eos_ix).float()
     loss = torch.sum(mask * nll) / torch.sum(mask)
     return loss, enc_hid_state
@@ -337,10 +338,7 @@ def infer_mask(out, eos_ix, include_eos=True):
 def to_one_hot(y, n_dims=None):
     """ Take the integer y (tensor or variable) with n dimensions and
         convert it to 1-hot representation with n+1 dimensions. """
-    y_tensor = y
-    y_tensor = y_tensor.type(torch.LongTensor).view(-1, 1)
-    n_dims = n_dims if n_dims is not None else int(torch.max(y_tensor)) + 1
-    y_one_hot = torch.zeros(y_tensor.size()[0], n_dims).scatter_(1, y_tensor, 1)
-    y_one_hot = y_one_hot.view(*y.shape, -1)
+    n_dims = n_dims if n_dims is not None else -1
+    y_one_hot = F.one_hot(y.long(), num_classes=n_dims).float()
 
     return y_one_hot